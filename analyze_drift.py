@@ -2,89 +2,322 @@
 Analyze drift in prediction logs.
 Shows statistics per window to verify drift is detectable.
 """
-import json
+import io
+import mmap
+import os
+import sys
+import tempfile
+import warnings
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from datetime import datetime
 import numpy as np
 
+try:
+    from orjson import loads as json_loads
+except ImportError:  # orjson is optional; stdlib json accepts the same input
+    from json import loads as json_loads
 
-def load_predictions(log_file):
-    """Load predictions from JSONL file."""
-    predictions = []
-    with open(log_file, "r") as f:
-        for line in f:
-            if line.strip():
-                predictions.append(json.loads(line))
-    return predictions
+try:
+    from ciso8601 import parse_datetime
+except ImportError:  # ciso8601 is optional; it only speeds up the slow path below
+    def parse_datetime(s):
+        return datetime.fromisoformat(s.replace("Z", "+00:00"))
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+# Fan window statistics out to worker processes once predictions x windows
+# exceeds this; below it, pool startup costs more than it saves
+PARALLEL_THRESHOLD = 10**8
+
+
+def parse_timestamps(timestamps):
+    """
+    Parse ISO-8601 UTC timestamps into an int64 nanosecond array.
+
+    All timestamps share the ``...Z`` format, so one vectorized datetime64 cast
+    replaces per-row ``datetime.fromisoformat`` calls. The ``Z`` suffix is
+    dropped first since numpy deprecates parsing timezone designators.
+
+    Strings numpy cannot cast cleanly (e.g. explicit ``+hh:mm`` offsets) fall
+    back to per-row ``parse_datetime``; naive timestamps are taken as UTC.
+    """
+    stripped = [t.rstrip("Z") for t in timestamps]
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", DeprecationWarning)
+            return np.array(stripped, dtype="datetime64[ns]").view("i8")
+    except (ValueError, DeprecationWarning):
+        pass
+
+    out = np.empty(len(timestamps), dtype=np.int64)
+    for i, t in enumerate(timestamps):
+        dt = parse_datetime(t)
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=timezone.utc)
+        out[i] = (dt - _EPOCH) // _MICROSECOND * 1000
+    return out
+
+
+def stats(x):
+    """
+    Return (count, mean, std, min, max) of a 1-D array.
+
+    Sum-of-squares comes from a single ``np.dot`` (one BLAS kernel) rather
+    than separate ``.mean()``/``.std()`` passes over the data. Predictions are
+    stored as float32; the accumulators are widened to float64.
+    """
+    n = x.size
+    xd = x.astype(np.float64, copy=False)
+    mean = xd.sum() / n
+    var = np.dot(xd, xd) / n - mean * mean
+    return n, mean, np.sqrt(max(var, 0.0)), x.min(), x.max()
+
+
+def _decode_lines(lines):
+    """Decode JSONL lines into (timestamp_ns, prediction, drift_phase) arrays."""
+    timestamps = []
+    preds = array("f")
+    phases = array("q")
+    for line in lines:
+        if line.strip():
+            p = json_loads(line)
+            timestamps.append(p["timestamp"])
+            preds.append(p["prediction"])
+            phases.append(p["drift_phase"])
+
+    # array buffers are wrapped without a copy (a list would be walked twice)
+    return (
+        parse_timestamps(timestamps),
+        np.frombuffer(preds, dtype=np.float32),
+        np.frombuffer(phases, dtype=np.int64),
+    )
+
+
+def stream_predictions(log_file, chunk=65536):
+    """
+    Stream predictions from a memory-mapped JSONL file in fixed-size chunks.
+
+    Newline offsets are located with a vectorized byte compare over each
+    ``chunk``-sized slice of the mapping, and each line's bytes are handed
+    straight to the JSON decoder. Yields ``(timestamp_ns, prediction,
+    drift_phase)`` arrays per chunk, so pages are only touched as they are
+    consumed.
+    """
+    with open(log_file, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if not size:
+            return
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            view = np.frombuffer(mm, dtype=np.uint8)
+            try:
+                start = 0
+                for offset in range(0, size, chunk):
+                    newlines = np.flatnonzero(view[offset:offset + chunk] == 0x0A) + offset
+                    lines = []
+                    for end in newlines.tolist():
+                        lines.append(mm[start:end])
+                        start = end + 1
+                    yield _decode_lines(lines)
+
+                # Final record without a trailing newline
+                if start < size:
+                    yield _decode_lines([mm[start:]])
+            finally:
+                # Release the exported buffer before the mapping is closed
+                del view
 
 
 def load_window_metadata(metadata_file):
     """Load window metadata."""
-    with open(metadata_file, "r") as f:
-        return json.load(f)
+    with open(metadata_file, "rb") as f:
+        return json_loads(f.read())
+
+
+def window_bounds(windows):
+    """Parse window start/end timestamps once into int64 nanosecond arrays."""
+    starts = parse_timestamps([w["start_timestamp"] for w in windows])
+    ends = parse_timestamps([w["end_timestamp"] for w in windows])
+    return starts, ends
+
+
+def _window_slice_stats(ts_sorted, preds_sorted, starts, ends):
+    """
+    Compute (count, mean, std, min, max) arrays for a run of windows.
+
+    ``ts_sorted`` must be ascending with ``preds_sorted`` in the same order,
+    so each inclusive [start, end] window is one contiguous slice.
+    """
+    lo = np.searchsorted(ts_sorted, starts, side="left")
+    hi = np.searchsorted(ts_sorted, ends, side="right")
+
+    out = np.zeros((5, len(starts)))
+    for i, (a, b) in enumerate(zip(lo.tolist(), hi.tolist())):
+        if b > a:
+            out[:, i] = stats(preds_sorted[a:b])
+    return out
+
+
+def _window_stats_worker(ts_path, preds_path, starts, ends):
+    """Process-pool entry point: map the shared arrays and reduce one window chunk."""
+    ts_sorted = np.load(ts_path, mmap_mode="r")
+    preds_sorted = np.load(preds_path, mmap_mode="r")
+    return _window_slice_stats(ts_sorted, preds_sorted, starts, ends)
+
+
+def window_statistics(ts_ns, preds, starts, ends, workers=None):
+    """
+    Compute per-window statistics for predictions falling in [start, end].
+
+    Predictions are sorted by timestamp once so every window reduces to a
+    contiguous slice. Above ``PARALLEL_THRESHOLD`` the windows are split into
+    chunks reduced by a ``ProcessPoolExecutor``; the sorted arrays are shared
+    with workers as memory-mapped ``.npy`` files rather than pickled.
+
+    Returns:
+        Dict of arrays keyed by count, mean, std, min and max
+    """
+    order = np.argsort(ts_ns, kind="stable")
+    ts_sorted = ts_ns[order]
+    preds_sorted = preds[order]
 
+    workers = workers or os.cpu_count() or 1
+    n_windows = len(starts)
 
-def analyze_by_window(predictions, windows):
+    if workers > 1 and n_windows > 1 and ts_ns.size * n_windows > PARALLEL_THRESHOLD:
+        bounds = np.linspace(0, n_windows, min(workers, n_windows) + 1, dtype=int)
+        with tempfile.TemporaryDirectory() as tmp:
+            ts_path = os.path.join(tmp, "ts.npy")
+            preds_path = os.path.join(tmp, "preds.npy")
+            np.save(ts_path, ts_sorted)
+            np.save(preds_path, preds_sorted)
+
+            with ProcessPoolExecutor(max_workers=len(bounds) - 1) as pool:
+                futures = [
+                    pool.submit(_window_stats_worker, ts_path, preds_path, starts[a:b], ends[a:b])
+                    for a, b in zip(bounds[:-1], bounds[1:])
+                ]
+                out = np.concatenate([f.result() for f in futures], axis=1)
+    else:
+        out = _window_slice_stats(ts_sorted, preds_sorted, starts, ends)
+
+    count, mean, std, mn, mx = out
+    return {"count": count.astype(np.int64), "mean": mean, "std": std, "min": mn, "max": mx}
+
+
+def collect_statistics(log_file, starts, ends):
+    """
+    Load predictions in a single streaming pass and compute window statistics.
+
+    Timestamps, prediction values and phase ids are appended to compact
+    ``array`` buffers; per-window statistics are then reduced by
+    ``window_statistics``.
+
+    Args:
+        log_file: Path to predictions JSONL file
+        starts: Window start times as int64 nanoseconds (see ``window_bounds``)
+        ends: Window end times as int64 nanoseconds
+
+    Returns:
+        Tuple of (window_stats dict of arrays, predictions array, phases array)
+    """
+    all_ts = array("q")
+    all_preds = array("f")
+    all_phases = array("q")
+
+    # Chunks are appended as raw bytes; array.extend() would box every element
+    for ts_ns, preds, phases in stream_predictions(log_file):
+        all_ts.frombytes(ts_ns.astype(np.int64, copy=False).tobytes())
+        all_preds.frombytes(preds.tobytes())
+        all_phases.frombytes(phases.tobytes())
+
+    preds = np.frombuffer(all_preds, dtype=np.float32)
+    window_stats = window_statistics(np.frombuffer(all_ts, dtype=np.int64), preds, starts, ends)
+
+    return window_stats, preds, np.frombuffer(all_phases, dtype=np.int64)
+
+
+# One template per window/phase block keeps formatting to a single call per row
+_BLOCK = (
+    "{header}:\n"
+    "  Count: {count}\n"
+    "  Mean:  {mean:.4f}\n"
+    "  Std:   {std:.4f}\n"
+    "  Min:   {min:.4f}\n"
+    "  Max:   {max:.4f}\n"
+    "\n"
+)
+
+
+def _section_header(title):
+    """Return a report section banner followed by a blank line."""
+    rule = "=" * 70
+    return f"{rule}\n{title}\n{rule}\n\n"
+
+
+def analyze_by_window(window_stats, windows):
     """Analyze predictions grouped by window."""
-    print("=" * 70)
-    print("Drift Analysis by Window")
-    print("=" * 70)
-    print()
-
-    # Group predictions by window based on timestamp
-    for window in windows:
-        window_id = window["window_id"]
-        start_time = datetime.fromisoformat(window["start_timestamp"].replace("Z", "+00:00"))
-        end_time = datetime.fromisoformat(window["end_timestamp"].replace("Z", "+00:00"))
-
-        # Get predictions in this window
-        window_predictions = [
-            p["prediction"] for p in predictions
-            if start_time <= datetime.fromisoformat(p["timestamp"].replace("Z", "+00:00")) <= end_time
-        ]
-
-        if window_predictions:
-            preds = np.array(window_predictions)
-            print(f"Window {window_id} (drift={window['is_drift']}):")
-            print(f"  Count: {len(preds)}")
-            print(f"  Mean:  {preds.mean():.4f}")
-            print(f"  Std:   {preds.std():.4f}")
-            print(f"  Min:   {preds.min():.4f}")
-            print(f"  Max:   {preds.max():.4f}")
-            print()
-
-
-def analyze_by_phase(predictions):
+    out = io.StringIO()
+    out.write(_section_header("Drift Analysis by Window"))
+
+    for i, window in enumerate(windows):
+        count = window_stats["count"][i]
+
+        if count:
+            out.write(_BLOCK.format(
+                header=f"Window {window['window_id']} (drift={window['is_drift']})",
+                count=count,
+                mean=window_stats["mean"][i],
+                std=window_stats["std"][i],
+                min=window_stats["min"][i],
+                max=window_stats["max"][i],
+            ))
+
+    # Flush the whole report in one write instead of a print per line
+    sys.stdout.write(out.getvalue())
+
+
+def analyze_by_phase(preds, phases):
     """Analyze predictions grouped by drift phase."""
-    print("=" * 70)
-    print("Drift Analysis by Phase")
-    print("=" * 70)
-    print()
-
-    # Group by drift phase
-    phases = {}
-    for pred in predictions:
-        phase = pred["drift_phase"]
-        if phase not in phases:
-            phases[phase] = []
-        phases[phase].append(pred["prediction"])
-
-    for phase_id in sorted(phases.keys()):
-        preds = np.array(phases[phase_id])
-        print(f"Phase {phase_id}:")
-        print(f"  Count: {len(preds)}")
-        print(f"  Mean:  {preds.mean():.4f}")
-        print(f"  Std:   {preds.std():.4f}")
-        print(f"  Min:   {preds.min():.4f}")
-        print(f"  Max:   {preds.max():.4f}")
-        print()
+    out = io.StringIO()
+    out.write(_section_header("Drift Analysis by Phase"))
+
+    if not preds.size:
+        sys.stdout.write(out.getvalue())
+        return
+
+    # Sort by phase so each phase is a contiguous run, then reduce every run at once.
+    # Run boundaries come from the sorted keys directly rather than a second sort in np.unique.
+    order = np.argsort(phases, kind="stable")
+    p_sorted = preds[order]
+    k_sorted = phases[order]
+    starts = np.flatnonzero(np.concatenate(([True], k_sorted[1:] != k_sorted[:-1])))
+    uniq = k_sorted[starts]
+
+    counts = np.diff(np.append(starts, p_sorted.size))
+    p64 = p_sorted.astype(np.float64)
+    sums = np.add.reduceat(p64, starts)
+    sqsums = np.add.reduceat(p64 * p64, starts)
+    mins = np.minimum.reduceat(p_sorted, starts)
+    maxs = np.maximum.reduceat(p_sorted, starts)
+
+    means = sums / counts
+    stds = np.sqrt(np.maximum(sqsums / counts - means * means, 0.0))
+
+    for phase_id, count, mean, std, mn, mx in zip(uniq, counts, means, stds, mins, maxs):
+        out.write(_BLOCK.format(
+            header=f"Phase {phase_id}", count=count, mean=mean, std=std, min=mn, max=mx
+        ))
+
+    sys.stdout.write(out.getvalue())
 
 
 def main():
     """Main entry point."""
     import argparse
-    import sys
-    import os
 
     parser = argparse.ArgumentParser(
         description="Analyze drift statistics in prediction logs",
@@ -150,29 +383,30 @@ Examples:
 
     # Load data
     try:
-        predictions = load_predictions(log_file)
         windows = load_window_metadata(args.metadata)
+        starts, ends = window_bounds(windows)
+        window_stats, all_preds, all_phases = collect_statistics(log_file, starts, ends)
     except FileNotFoundError as e:
         print(f"\n✗ Error: File not found - {e}")
         print(f"  Make sure to run drift simulation first.")
         sys.exit(1)
 
-    print(f"\nLoaded {len(predictions)} predictions across {len(windows)} windows\n")
+    print(f"\nLoaded {len(all_preds)} predictions across {len(windows)} windows\n")
 
     # Analyze
-    analyze_by_window(predictions, windows)
-    analyze_by_phase(predictions)
+    analyze_by_window(window_stats, windows)
+    analyze_by_phase(all_preds, all_phases)
 
     # Summary
     print("=" * 70)
     print("Summary")
     print("=" * 70)
-    all_preds = np.array([p["prediction"] for p in predictions])
+    count, mean, std, mn, mx = stats(all_preds)
     print(f"Overall statistics:")
-    print(f"  Total predictions: {len(all_preds)}")
-    print(f"  Mean: {all_preds.mean():.4f}")
-    print(f"  Std:  {all_preds.std():.4f}")
-    print(f"  Range: [{all_preds.min():.4f}, {all_preds.max():.4f}]")
+    print(f"  Total predictions: {count}")
+    print(f"  Mean: {mean:.4f}")
+    print(f"  Std:  {std:.4f}")
+    print(f"  Range: [{mn:.4f}, {mx:.4f}]")
 
 
 if __name__ == "__main__":
@@ -2,14 +2,51 @@
 Create a pre-fitted logistic regression model without training.
 This uses sklearn's built-in iris dataset structure as a template.
 """
+import hashlib
+import os
 import pickle
 import numpy as np
 from sklearn.linear_model import LogisticRegression
 from sklearn.datasets import load_iris
 
 
-def create_prefitted_model():
-    """Create a pre-fitted logistic regression model."""
+MODEL_VERSION = "v1.0"
+FEATURE_NAMES = ["feature1", "feature2", "feature3"]
+
+# Identifies the training recipe; bump when the data or target changes
+MODEL_KEY = hashlib.sha256(f"iris-first3-binary-{MODEL_VERSION}".encode()).hexdigest()
+
+
+def _is_cached(model_path, metadata_path):
+    """Check whether saved model files already match the requested model."""
+    if not (os.path.exists(model_path) and os.path.exists(metadata_path)):
+        return False
+    try:
+        with open(metadata_path, "rb") as f:
+            metadata = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        return False
+    return (
+        metadata.get("version") == MODEL_VERSION
+        and metadata.get("n_features") == len(FEATURE_NAMES)
+        and metadata.get("model_key") == MODEL_KEY
+    )
+
+
+def create_prefitted_model(force=False):
+    """
+    Create a pre-fitted logistic regression model.
+
+    Args:
+        force: If True, refit and overwrite even if matching files exist
+    """
+    model_path = "models/model_v1.0.pkl"
+    metadata_path = "models/model_metadata.pkl"
+
+    if not force and _is_cached(model_path, metadata_path):
+        print(f"Model {MODEL_VERSION} already up to date at {model_path} (cached)")
+        return
+
     # Load iris dataset to get a valid structure
     iris = load_iris()
 
@@ -23,24 +60,23 @@ def create_prefitted_model():
 
     print("Pre-fitted model created successfully!")
     print(f"Model type: {type(model).__name__}")
-    print(f"Number of features: 3")
-    print(f"Feature names: feature1, feature2, feature3")
+    print(f"Number of features: {len(FEATURE_NAMES)}")
+    print(f"Feature names: {', '.join(FEATURE_NAMES)}")
 
     # Save the model
-    model_path = "models/model_v1.0.pkl"
     with open(model_path, "wb") as f:
         pickle.dump(model, f)
     print(f"Model saved to {model_path}")
 
     # Save model metadata
     metadata = {
-        "version": "v1.0",
+        "version": MODEL_VERSION,
         "model_type": "LogisticRegression",
-        "n_features": 3,
-        "feature_names": ["feature1", "feature2", "feature3"]
+        "n_features": len(FEATURE_NAMES),
+        "feature_names": FEATURE_NAMES,
+        "model_key": MODEL_KEY
     }
 
-    metadata_path = "models/model_metadata.pkl"
     with open(metadata_path, "wb") as f:
         pickle.dump(metadata, f)
     print(f"Metadata saved to {metadata_path}")
@@ -52,4 +88,14 @@ def create_prefitted_model():
 
 
 if __name__ == "__main__":
-    create_prefitted_model()
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Create the pre-fitted drift detection model")
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Refit and overwrite the model even if a matching one exists"
+    )
+    args = parser.parse_args()
+
+    create_prefitted_model(force=args.force)
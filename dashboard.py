@@ -2,7 +2,6 @@
 Drift Detection Dashboard - Epic 4
 Minimal MVP using Streamlit and Plotly for visualization.
 """
-import json
 import os
 from datetime import datetime
 from pathlib import Path
@@ -12,6 +11,21 @@ import plotly.graph_objects as go
 import plotly.express as px
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+try:
+    from orjson import loads as json_loads
+except ImportError:  # orjson is optional; stdlib json accepts the same input
+    from json import loads as json_loads
+
+
+# Cap on points sent to the browser for the feature time series
+MAX_PLOT_POINTS = 5000
+HISTOGRAM_BINS = 30
+
+# Parquet schema metadata key holding the log signature a cache was built from
+PARQUET_SIGNATURE_KEY = b'drift_log_signature'
 
 
 # Page configuration
@@ -23,22 +37,91 @@ st.set_page_config(
 )
 
 
+def _log_signature_bytes(mtime_ns, size):
+    """Encode a log file's (mtime_ns, size) for the Parquet cache metadata."""
+    return f"{mtime_ns}:{size}".encode()
+
+
+def load_predictions_cached(log_file):
+    """
+    Load predictions as a flattened DataFrame, backed by a Parquet cache.
+
+    The parsed frame is persisted next to the JSONL as ``<log_file>.parquet``
+    together with the log's ``(st_mtime_ns, size)`` as it was when parsing
+    started, and reused only while the log still has that signature, so
+    repeat loads skip JSON parsing entirely and appends made during a parse
+    are picked up on the next load.
+    """
+    parquet_file = f"{log_file}.parquet"
+    st_log = os.stat(log_file)
+    if os.path.exists(parquet_file):
+        try:
+            metadata = pq.read_schema(parquet_file).metadata or {}
+        except (OSError, pa.ArrowInvalid):
+            metadata = {}
+        if metadata.get(PARQUET_SIGNATURE_KEY) == _log_signature_bytes(st_log.st_mtime_ns, st_log.st_size):
+            return pd.read_parquet(parquet_file)
+
+    # Parse only what was on disk when the log was stat'ed, up to its last
+    # complete line, so the stored signature describes exactly the cached rows
+    with open(log_file, 'rb') as f:
+        data = f.read(st_log.st_size)
+    parsed_size = data.rfind(b'\n') + 1
+    data = data[:parsed_size]
+
+    # Build columns directly while parsing, flattening input_features per row
+    columns = {'timestamp': [], 'prediction': [], 'model_version': [], 'drift_phase': []}
+    features = {}
+    count = 0
+    for line in data.splitlines():
+        if line.strip():
+            record = json_loads(line)
+            columns['timestamp'].append(record['timestamp'])
+            columns['prediction'].append(record['prediction'])
+            columns['model_version'].append(record.get('model_version'))
+            columns['drift_phase'].append(record.get('drift_phase'))
+
+            record_features = record['input_features']
+            for name in record_features:
+                if name not in features:
+                    features[name] = [np.nan] * count
+            for name, values in features.items():
+                values.append(record_features.get(name, np.nan))
+            count += 1
+
+    columns.update(features)
+    df = pd.DataFrame(columns)
+    df['timestamp'] = pd.to_datetime(df['timestamp'], utc=True, format='ISO8601')
+
+    # Keep rows time-ordered so range filters can bisect the timestamp column
+    df = df.sort_values('timestamp', kind='stable').reset_index(drop=True)
+
+    # A trailing partial line leaves parsed_size short of st_size, so the
+    # cache is treated as stale until that line is complete
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    table = table.replace_schema_metadata({
+        **(table.schema.metadata or {}),
+        PARQUET_SIGNATURE_KEY: _log_signature_bytes(st_log.st_mtime_ns, parsed_size),
+    })
+    try:
+        pq.write_table(table, parquet_file, compression='zstd')
+    except OSError:
+        pass  # Cache is best-effort; a read-only logs/ still works
+
+    return df
+
+
 @st.cache_data
-def load_predictions(log_file):
-    """Load predictions from JSONL file."""
-    predictions = []
-    with open(log_file, 'r') as f:
-        for line in f:
-            if line.strip():
-                predictions.append(json.loads(line))
-    return predictions
+def load_predictions(log_file, mtime):
+    """Load predictions DataFrame (mtime keys the Streamlit cache to file changes)."""
+    return load_predictions_cached(log_file)
 
 
 @st.cache_data
 def load_window_metadata(metadata_file):
     """Load window metadata from JSON."""
-    with open(metadata_file, 'r') as f:
-        return json.load(f)
+    with open(metadata_file, 'rb') as f:
+        return json_loads(f.read())
 
 
 @st.cache_data
@@ -46,20 +129,8 @@ def load_drift_detection(detection_file):
     """Load drift detection results from JSON."""
     if not os.path.exists(detection_file):
         return None
-    with open(detection_file, 'r') as f:
-        return json.load(f)
-
-
-def prepare_dataframe(predictions):
-    """Convert predictions to pandas DataFrame."""
-    df = pd.DataFrame(predictions)
-    df['timestamp'] = pd.to_datetime(df['timestamp'])
-
-    # Extract features into separate columns
-    features_df = pd.json_normalize(df['input_features'])
-    df = pd.concat([df.drop('input_features', axis=1), features_df], axis=1)
-
-    return df
+    with open(detection_file, 'rb') as f:
+        return json_loads(f.read())
 
 
 def get_available_log_files():
@@ -99,8 +170,7 @@ def main():
 
         # Load data
         try:
-            predictions = load_predictions(log_path)
-            df = prepare_dataframe(predictions)
+            df = load_predictions(log_path, os.path.getmtime(log_path))
 
             # Try to load optional files
             windows = None
@@ -109,6 +179,10 @@ def main():
             if os.path.exists(metadata_path):
                 windows = load_window_metadata(metadata_path)
 
+                # Parse window boundaries once per rerun instead of per use
+                window_starts = pd.to_datetime([w['start_timestamp'] for w in windows], utc=True)
+                window_ends = pd.to_datetime([w['end_timestamp'] for w in windows], utc=True)
+
             if os.path.exists(detection_path):
                 detections = load_drift_detection(detection_path)
 
@@ -117,7 +191,7 @@ def main():
             st.stop()
 
         # Data info
-        st.metric("Total Predictions", len(predictions))
+        st.metric("Total Predictions", len(df))
         if windows:
             st.metric("Total Windows", len(windows))
         if detections:
@@ -158,13 +232,14 @@ def main():
 
         # Get timestamp range from windows
         if start_window < len(windows) and end_window < len(windows):
-            start_time = pd.to_datetime(windows[start_window]['start_timestamp'])
-            end_time = pd.to_datetime(windows[end_window]['end_timestamp'])
-
-            filtered_df = df[
-                (df['timestamp'] >= start_time) &
-                (df['timestamp'] <= end_time)
-            ]
+            start_time = window_starts[start_window]
+            end_time = window_ends[end_window]
+
+            # Rows are sorted by timestamp, so bisect instead of masking every row
+            ts = df['timestamp'].values
+            lo = np.searchsorted(ts, start_time.to_datetime64(), side='left')
+            hi = np.searchsorted(ts, end_time.to_datetime64(), side='right')
+            filtered_df = df.iloc[lo:hi]
         else:
             filtered_df = df
     else:
@@ -176,53 +251,65 @@ def main():
     with col1:
         st.subheader("Feature Over Time")
 
-        # Time series plot
+        # Time series plot, stride-downsampled and rendered with WebGL
+        plot_df = filtered_df
+        if len(plot_df) > MAX_PLOT_POINTS:
+            idx = np.linspace(0, len(plot_df) - 1, MAX_PLOT_POINTS, dtype=int)
+            plot_df = plot_df.iloc[idx]
+
         fig_timeseries = go.Figure()
 
-        fig_timeseries.add_trace(go.Scatter(
-            x=filtered_df['timestamp'],
-            y=filtered_df[selected_feature],
+        fig_timeseries.add_trace(go.Scattergl(
+            x=plot_df['timestamp'],
+            y=plot_df[selected_feature],
             mode='lines+markers',
             name=selected_feature,
             marker=dict(size=4),
             line=dict(width=1)
         ))
 
-        # Add drift markers if available
+        # Add drift markers if available, batched into a single layout update
+        drift_shapes = []
+        drift_annotations = []
         if detections and windows:
-            drift_windows = [d['window_id'] for d in detections if d['drift_detected']]
-            for window_id in drift_windows:
-                if start_window <= window_id <= end_window and window_id < len(windows):
-                    window = windows[window_id]
-                    drift_time = pd.to_datetime(window['start_timestamp'])
-
-                    # Add vertical line using shape instead of add_vline
-                    fig_timeseries.add_shape(
-                        type="line",
-                        x0=drift_time,
-                        x1=drift_time,
-                        y0=0,
-                        y1=1,
-                        yref="paper",
-                        line=dict(color="red", width=2, dash="dash")
-                    )
-
-                    # Add annotation for the drift marker
-                    fig_timeseries.add_annotation(
-                        x=drift_time,
-                        y=1,
-                        yref="paper",
-                        text="Drift",
-                        showarrow=False,
-                        yshift=10,
-                        font=dict(color="red", size=10)
-                    )
+            drift_windows = np.fromiter(
+                (d['window_id'] for d in detections if d['drift_detected']), dtype=np.int64
+            )
+            drift_windows = drift_windows[
+                (drift_windows >= start_window) &
+                (drift_windows <= end_window) &
+                (drift_windows < len(windows))
+            ]
+            for drift_time in window_starts[drift_windows]:
+                # Vertical line using shape instead of add_vline
+                drift_shapes.append(dict(
+                    type="line",
+                    x0=drift_time,
+                    x1=drift_time,
+                    y0=0,
+                    y1=1,
+                    yref="paper",
+                    line=dict(color="red", width=2, dash="dash")
+                ))
+
+                # Annotation for the drift marker
+                drift_annotations.append(dict(
+                    x=drift_time,
+                    y=1,
+                    yref="paper",
+                    text="Drift",
+                    showarrow=False,
+                    yshift=10,
+                    font=dict(color="red", size=10)
+                ))
 
         fig_timeseries.update_layout(
             xaxis_title="Time",
             yaxis_title=f"{selected_feature} Value",
             hovermode='x unified',
-            height=400
+            height=400,
+            shapes=drift_shapes,
+            annotations=drift_annotations
         )
 
         st.plotly_chart(fig_timeseries, use_container_width=True)
@@ -230,12 +317,16 @@ def main():
     with col2:
         st.subheader("Feature Distribution")
 
-        # Histogram
+        # Histogram binned server-side so only bin counts are sent to the browser
+        values = filtered_df[selected_feature].to_numpy(dtype=float)
+        counts, edges = np.histogram(values[~np.isnan(values)], bins=HISTOGRAM_BINS)
+
         fig_hist = go.Figure()
 
-        fig_hist.add_trace(go.Histogram(
-            x=filtered_df[selected_feature],
-            nbinsx=30,
+        fig_hist.add_trace(go.Bar(
+            x=(edges[:-1] + edges[1:]) / 2,
+            y=counts,
+            width=np.diff(edges),
             name=selected_feature,
             marker_color='steelblue'
         ))
@@ -244,6 +335,7 @@ def main():
             xaxis_title=f"{selected_feature} Value",
             yaxis_title="Count",
             height=400,
+            bargap=0,
             showlegend=False
         )
 
@@ -307,12 +399,12 @@ def main():
             # Create comparison if ground truth available
             if 'ground_truth_drift' in detection_df.columns:
                 comparison = detection_df[['window_id', 'drift_detected', 'ground_truth_drift']].copy()
-                comparison['status'] = comparison.apply(
-                    lambda row: 'True Positive' if row['drift_detected'] and row['ground_truth_drift']
-                    else 'False Positive' if row['drift_detected'] and not row['ground_truth_drift']
-                    else 'False Negative' if not row['drift_detected'] and row['ground_truth_drift']
-                    else 'True Negative',
-                    axis=1
+                detected = comparison['drift_detected'].fillna(False).to_numpy(dtype=bool)
+                truth = comparison['ground_truth_drift'].fillna(False).to_numpy(dtype=bool)
+                comparison['status'] = np.select(
+                    [detected & truth, detected & ~truth, ~detected & truth],
+                    ['True Positive', 'False Positive', 'False Negative'],
+                    default='True Negative'
                 )
 
                 # Bar chart of detection status
@@ -1,10 +1,15 @@
 """
 Diagnostic tool for real-time drift analyzer issues.
 """
-import json
+import mmap
 from pathlib import Path
 from datetime import datetime
 
+try:
+    from orjson import loads as json_loads
+except ImportError:  # orjson is optional; stdlib json accepts the same input
+    from json import loads as json_loads
+
 def diagnose():
     """Diagnose common real-time analyzer issues."""
     print("=" * 70)
@@ -26,9 +31,24 @@ def diagnose():
 
     # Count predictions
     try:
-        with open(log_file, 'r') as f:
-            lines = [line.strip() for line in f if line.strip()]
-            prediction_count = len(lines)
+        prediction_count = 0
+        if log_file.stat().st_size > 0:
+            # Map the file and walk it line by line; only the first and last
+            # records are decoded, and blank lines are not counted
+            with open(log_file, 'rb') as f, \
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                first_line = None
+                for line in iter(mm.readline, b''):
+                    if line.strip():
+                        prediction_count += 1
+                        if first_line is None:
+                            first_line = line
+
+                # Last record: trim trailing whitespace (blank lines) before searching back
+                end = len(mm)
+                while end > 0 and mm[end - 1] in b' \t\r\n\f\v':
+                    end -= 1
+                last_line = mm[mm.rfind(b'\n', 0, end) + 1:end]
 
         print(f"   ✅ Total predictions in file: {prediction_count}")
 
@@ -37,11 +57,11 @@ def diagnose():
             return
 
         # Check first prediction
-        first_pred = json.loads(lines[0])
+        first_pred = json_loads(first_line)
         print(f"   ✅ First prediction timestamp: {first_pred['timestamp']}")
 
         # Check last prediction
-        last_pred = json.loads(lines[-1])
+        last_pred = json_loads(last_line)
         print(f"   ✅ Last prediction timestamp: {last_pred['timestamp']}")
 
         # Calculate window coverage
@@ -3,25 +3,107 @@ Real-Time Drift Analyzer using File Tailing
 Monitors prediction log files and performs live drift detection.
 """
 import json
+import math
+import mmap
 import time
 import os
+import queue
+import select
 import signal
 import sys
+import threading
 from pathlib import Path
 from datetime import datetime
 from collections import deque
-from typing import Dict, List, Optional, Deque
+from typing import Callable, Deque, Dict, List, Optional
 from dataclasses import dataclass, asdict
 
 import numpy as np
 from river.drift import ADWIN
-from watchdog.observers import Observer
-from watchdog.events import FileSystemEventHandler, FileModifiedEvent
 
+try:
+    from orjson import loads as json_loads
+except ImportError:  # orjson is optional; stdlib json accepts the same input
+    from json import loads as json_loads
 
-@dataclass
+try:
+    from inotify_simple import INotify, flags as inotify_flags
+except ImportError:  # inotify_simple is optional (Linux); kqueue or plain sleeps are used instead
+    INotify = None
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the update runs as plain Python without it
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+# Log polling interval bounds in seconds
+MIN_POLL_INTERVAL = 0.05
+MAX_POLL_INTERVAL = 1.0
+
+# Seconds between periodic status updates while monitoring
+STATUS_INTERVAL = 60
+
+# Bytes requested per os.read() when draining newly appended log data
+READ_CHUNK_SIZE = 1 << 20
+
+# Most recent drift alerts retained by RealtimeDriftDetector.alerts
+MAX_ALERT_HISTORY = 1024
+
+# Alerts waiting for a slow handler before new stable-window alerts are dropped
+ALERT_QUEUE_SIZE = 1024
+
+
+@njit(cache=True)
+def _welford_add(count, mean, m2, value):
+    """Add ``value`` to running (count, mean, M2) moments (Welford)."""
+    count += 1
+    delta = value - mean
+    mean += delta / count
+    m2 += delta * (value - mean)
+    return count, mean, m2
+
+
+@njit(cache=True)
+def _welford_remove(count, mean, m2, value):
+    """Remove ``value`` from running (count, mean, M2) moments; inverse of ``_welford_add``."""
+    count -= 1
+    if count == 0:
+        return 0, 0.0, 0.0
+    delta = value - mean
+    mean -= delta / count
+    m2 -= delta * (value - mean)
+    return count, mean, max(m2, 0.0)
+
+
+@njit(cache=True)
+def _ring_update(buf, head, count, mean, m2, value):
+    """
+    Push ``value`` into the ring buffer and update its running moments.
+
+    Returns the new ``(head, count, mean, m2)``. Compiled with numba when
+    it is installed so the per-prediction numeric core skips the interpreter.
+    """
+    size = buf.shape[0]
+    if count == size:
+        count, mean, m2 = _welford_remove(count, mean, m2, buf[head])
+
+    count, mean, m2 = _welford_add(count, mean, m2, value)
+    buf[head] = value
+    head = (head + 1) % size
+    return head, count, mean, m2
+
+
+# dataclass(slots=True) needs Python 3.10+; older interpreters keep a __dict__
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class DriftAlert:
-    """Container for drift detection alerts."""
+    """Container for drift detection alerts (immutable once created)."""
     window_id: int
     timestamp: str
     drift_detected: bool
@@ -30,7 +112,83 @@ class DriftAlert:
     current_mean: float
     current_std: float
     predictions_in_window: int
-    alert_message: str
+    adwin_drift: bool = False
+    baseline_drift: bool = False
+
+    @property
+    def alert_message(self) -> str:
+        """Human-readable alert message, formatted only when requested."""
+        if self.drift_detected:
+            change_pct = (self.drift_statistic / self.baseline_mean * 100) if self.baseline_mean != 0 else 0
+
+            # Indicate which detector triggered
+            detector_info = []
+            if self.adwin_drift:
+                detector_info.append("ADWIN")
+            if self.baseline_drift:
+                detector_info.append("Baseline")
+            detector_str = f" [{', '.join(detector_info)}]" if detector_info else ""
+
+            return (
+                f"🚨 DRIFT DETECTED{detector_str}! Mean shifted from {self.baseline_mean:.4f} to "
+                f"{self.current_mean:.4f} ({change_pct:+.1f}%)"
+            )
+        else:
+            return f"✓ Stable - Mean: {self.current_mean:.4f}, Baseline: {self.baseline_mean:.4f}"
+
+
+class AlertDispatcher:
+    """
+    Delivers alerts to a handler on a background thread.
+
+    Keeps slow handlers (console output, webhooks) off the ingest path. If the
+    handler falls more than ``maxsize`` alerts behind, new stable-window alerts
+    are dropped and counted in ``dropped`` rather than blocking the caller;
+    drift alerts are never dropped and wait for room in the queue instead.
+    """
+
+    def __init__(self, handler: Callable[[DriftAlert], None], maxsize: int = ALERT_QUEUE_SIZE):
+        """
+        Initialize and start the dispatcher thread.
+
+        Args:
+            handler: Function called with each alert, in submission order
+            maxsize: Maximum number of alerts waiting for the handler
+        """
+        self.handler = handler
+        self.dropped = 0
+        self._queue: "queue.Queue[Optional[DriftAlert]]" = queue.Queue(maxsize=maxsize)
+        self._thread = threading.Thread(target=self._run, name="alert-dispatcher", daemon=True)
+        self._thread.start()
+
+    def submit(self, alert: DriftAlert):
+        """Queue an alert for delivery; only drift alerts block when the queue is full."""
+        if alert.drift_detected:
+            self._queue.put(alert)
+            return
+        try:
+            self._queue.put_nowait(alert)
+        except queue.Full:
+            self.dropped += 1
+
+    def _run(self):
+        """Worker loop: deliver alerts until the shutdown sentinel arrives."""
+        while True:
+            alert = self._queue.get()
+            if alert is None:
+                break
+            try:
+                self.handler(alert)
+            except Exception as e:
+                print(f"⚠️  Alert handler failed: {e}")
+
+    def close(self):
+        """Deliver any queued alerts, then stop the worker thread."""
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+            if self.dropped:
+                print(f"⚠️  {self.dropped} stable-window alerts dropped (alert handler fell behind)")
 
 
 class PredictionWindow:
@@ -44,9 +202,21 @@ class PredictionWindow:
             window_size: Maximum number of predictions in window
         """
         self.window_size = window_size
-        self.predictions: Deque[Dict] = deque(maxlen=window_size)
         self.window_id = 0
 
+        # Fixed-capacity ring buffer of prediction values; only the last
+        # timestamp is ever needed, so records themselves are not kept
+        self._buf = np.empty(window_size, dtype=np.float64)
+        self._head = 0
+        self._count = 0
+        self._last_ts: Optional[str] = None
+
+        # Running mean and M2 (Welford) so mean/std are O(1) and stay
+        # numerically stable however long the window keeps sliding
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._inv_size = 1.0 / window_size
+
     def add_prediction(self, prediction: Dict) -> bool:
         """
         Add a prediction to the window.
@@ -57,40 +227,89 @@ class PredictionWindow:
         Returns:
             True if window is complete after addition
         """
-        self.predictions.append(prediction)
-        return len(self.predictions) >= self.window_size
+        self._head, self._count, self._mean, self._m2 = _ring_update(
+            self._buf, self._head, self._count, self._mean, self._m2,
+            float(prediction["prediction"])
+        )
+        self._last_ts = prediction.get("timestamp")
+        return self._count >= self.window_size
+
+    def add_values(self, values: np.ndarray, last_timestamp: Optional[str]) -> bool:
+        """
+        Append a block of prediction values that fits in the remaining capacity.
+
+        Args:
+            values: float64 array with at most ``window_size - get_count()`` items
+            last_timestamp: Timestamp of the final value in ``values`` (may be None)
+
+        Returns:
+            True if window is complete after addition
+        """
+        n = values.size
+        if not n:
+            return self._count >= self.window_size
+
+        # Contiguous run from head, wrapping once at most
+        first = min(n, self.window_size - self._head)
+        self._buf[self._head:self._head + first] = values[:first]
+        self._buf[:n - first] = values[first:]
+
+        # Merge the block's moments into the running ones (Chan et al.)
+        block_mean = float(values.mean())
+        centered = values - block_mean
+        block_m2 = float(np.dot(centered, centered))
+        total = self._count + n
+        delta = block_mean - self._mean
+        self._mean += delta * n / total
+        self._m2 += block_m2 + delta * delta * self._count * n / total
+
+        self._head = (self._head + n) % self.window_size
+        self._count = total
+        self._last_ts = last_timestamp
+        return self._count >= self.window_size
 
     def get_prediction_values(self) -> np.ndarray:
-        """Extract prediction values as numpy array."""
-        return np.array([p["prediction"] for p in self.predictions])
+        """Extract prediction values as numpy array, oldest first."""
+        if self._count < self.window_size:
+            return self._buf[:self._count].copy()
+        return np.concatenate((self._buf[self._head:], self._buf[:self._head]))
+
+    def _inv_count(self) -> float:
+        """1/count, using the precomputed reciprocal for a full window."""
+        n = self._count
+        return self._inv_size if n == self.window_size else 1.0 / n
 
     def get_mean(self) -> float:
         """Calculate mean of predictions in window."""
-        values = self.get_prediction_values()
-        return float(values.mean()) if len(values) > 0 else 0.0
+        return self._mean if self._count > 0 else 0.0
 
     def get_std(self) -> float:
-        """Calculate standard deviation of predictions in window."""
-        values = self.get_prediction_values()
-        return float(values.std()) if len(values) > 0 else 0.0
+        """Calculate (population) standard deviation of predictions in window."""
+        if self._count == 0:
+            return 0.0
+        return math.sqrt(max(self._m2 * self._inv_count(), 0.0))
 
     def get_count(self) -> int:
         """Number of predictions in window."""
-        return len(self.predictions)
+        return self._count
 
     def get_timestamp(self) -> str:
-        """Get timestamp of the last prediction."""
-        if self.predictions:
-            return self.predictions[-1]["timestamp"]
+        """Get timestamp of the last prediction (now, if it had none)."""
+        if self._count and self._last_ts:
+            return self._last_ts
         return datetime.utcnow().isoformat() + "Z"
 
     def is_complete(self) -> bool:
         """Check if window has reached target size."""
-        return len(self.predictions) >= self.window_size
+        return self._count >= self.window_size
 
     def clear(self):
         """Clear the window and increment window ID."""
-        self.predictions.clear()
+        self._head = 0
+        self._count = 0
+        self._last_ts = None
+        self._mean = 0.0
+        self._m2 = 0.0
         self.window_id += 1
 
 
@@ -118,18 +337,26 @@ class RealtimeDriftDetector:
         self.delta = delta
         self.alert_callback = alert_callback
 
-        # Initialize ADWIN and window
-        self.adwin = ADWIN(delta=delta)
+        # Callbacks run on a background thread so they cannot stall ingest
+        self._dispatcher = AlertDispatcher(alert_callback) if alert_callback else None
+
+        # Initialize ADWIN and window. ADWIN sees one value (the mean) per
+        # window, so it checks for change on every update (clock=1)
+        self.adwin = ADWIN(delta=delta, clock=1)
         self.window = PredictionWindow(window_size)
 
+        # Baseline drift threshold, fixed for the detector's lifetime
+        # (scale delta to a reasonable threshold: 0.002 * 50 = 0.1 = 10%)
+        self._threshold = delta * 50
+
         # Statistics tracking
         self.baseline_mean: Optional[float] = None
         self.total_predictions = 0
         self.total_windows = 0
         self.drift_count = 0
 
-        # Alert history
-        self.alerts: List[DriftAlert] = []
+        # Alert history (drift events only, most recent MAX_ALERT_HISTORY)
+        self.alerts: Deque[DriftAlert] = deque(maxlen=MAX_ALERT_HISTORY)
 
     def process_prediction(self, prediction: Dict) -> Optional[DriftAlert]:
         """
@@ -145,21 +372,59 @@ class RealtimeDriftDetector:
         window_complete = self.window.add_prediction(prediction)
         self.total_predictions += 1
 
-        # Feed prediction value to ADWIN
-        pred_value = prediction["prediction"]
-        self.adwin.update(pred_value)
-
         # Check if window is complete
         if window_complete:
             alert = self._analyze_window()
             if alert:
-                if self.alert_callback:
-                    self.alert_callback(alert)
-                self.alerts.append(alert)
+                if self._dispatcher:
+                    self._dispatcher.submit(alert)
+                if alert.drift_detected:
+                    self.alerts.append(alert)
                 return alert
 
         return None
 
+    def process_batch(self, values: np.ndarray, timestamps: List[Optional[str]]) -> List[DriftAlert]:
+        """
+        Process a block of predictions and check each completed window for drift.
+
+        Equivalent to calling ``process_prediction`` for every value in order,
+        but each window's share of the block is written to the window buffer
+        and summed in one numpy operation.
+
+        Args:
+            values: Prediction values in arrival order
+            timestamps: Timestamp for each value
+
+        Returns:
+            Alerts for the windows completed by this block, in order
+        """
+        values = np.asarray(values, dtype=np.float64)
+        alerts = []
+        start = 0
+        total = values.size
+
+        while start < total:
+            # Fill at most up to the end of the current window
+            stop = min(total, start + self.window_size - self.window.get_count())
+            chunk = values[start:stop]
+
+            window_complete = self.window.add_values(chunk, timestamps[stop - 1])
+            self.total_predictions += chunk.size
+
+            if window_complete:
+                alert = self._analyze_window()
+                if alert:
+                    if self._dispatcher:
+                        self._dispatcher.submit(alert)
+                    if alert.drift_detected:
+                        self.alerts.append(alert)
+                    alerts.append(alert)
+
+            start = stop
+
+        return alerts
+
     def _analyze_window(self) -> Optional[DriftAlert]:
         """
         Analyze the current window for drift.
@@ -167,24 +432,26 @@ class RealtimeDriftDetector:
         Returns:
             DriftAlert if analysis triggered, None otherwise
         """
-        # Set baseline from first window
-        if self.baseline_mean is None:
-            self.baseline_mean = self.window.get_mean()
-
+        # Window moments are computed once and reused below
         current_mean = self.window.get_mean()
         current_std = self.window.get_std()
 
+        # Set baseline from first window
+        if self.baseline_mean is None:
+            self.baseline_mean = current_mean
+
         # Calculate drift statistic (absolute difference from baseline)
         drift_statistic = abs(current_mean - self.baseline_mean)
 
         # Check if ADWIN detected drift OR if mean differs significantly from baseline
-        # ADWIN detects changes between consecutive windows, so we also check absolute drift
+        # ADWIN tracks the sequence of window means, so it detects changes between
+        # consecutive windows; we also check absolute drift
+        self.adwin.update(current_mean)
         adwin_drift = self.adwin.drift_detected
 
         # Also flag drift if mean differs from baseline by more than threshold
         # Use a threshold based on delta parameter: drift if difference > 10% of baseline
-        threshold = self.delta * 50  # Scale delta to reasonable threshold (0.002 * 50 = 0.1 = 10%)
-        baseline_drift = drift_statistic > threshold if self.baseline_mean > 0 else False
+        baseline_drift = drift_statistic > self._threshold if self.baseline_mean > 0 else False
 
         drift_detected = adwin_drift or baseline_drift
 
@@ -196,14 +463,13 @@ class RealtimeDriftDetector:
             window_id=self.total_windows,
             timestamp=self.window.get_timestamp(),
             drift_detected=drift_detected,
-            drift_statistic=round(drift_statistic, 6),
-            baseline_mean=round(self.baseline_mean, 6),
-            current_mean=round(current_mean, 6),
-            current_std=round(current_std, 6),
+            drift_statistic=drift_statistic,
+            baseline_mean=self.baseline_mean,
+            current_mean=current_mean,
+            current_std=current_std,
             predictions_in_window=self.window.get_count(),
-            alert_message=self._create_alert_message(
-                drift_detected, drift_statistic, current_mean, adwin_drift, baseline_drift
-            )
+            adwin_drift=adwin_drift,
+            baseline_drift=baseline_drift
         )
 
         self.total_windows += 1
@@ -213,32 +479,10 @@ class RealtimeDriftDetector:
 
         return alert
 
-    def _create_alert_message(
-        self,
-        drift_detected: bool,
-        drift_statistic: float,
-        current_mean: float,
-        adwin_drift: bool,
-        baseline_drift: bool
-    ) -> str:
-        """Create human-readable alert message."""
-        if drift_detected:
-            change_pct = (drift_statistic / self.baseline_mean * 100) if self.baseline_mean != 0 else 0
-
-            # Indicate which detector triggered
-            detector_info = []
-            if adwin_drift:
-                detector_info.append("ADWIN")
-            if baseline_drift:
-                detector_info.append("Baseline")
-            detector_str = f" [{', '.join(detector_info)}]" if detector_info else ""
-
-            return (
-                f"🚨 DRIFT DETECTED{detector_str}! Mean shifted from {self.baseline_mean:.4f} to "
-                f"{current_mean:.4f} ({change_pct:+.1f}%)"
-            )
-        else:
-            return f"✓ Stable - Mean: {current_mean:.4f}, Baseline: {self.baseline_mean:.4f}"
+    def close(self):
+        """Flush pending alert callbacks and stop the dispatcher thread."""
+        if self._dispatcher:
+            self._dispatcher.close()
 
     def get_summary(self) -> Dict:
         """Get summary statistics."""
@@ -248,13 +492,98 @@ class RealtimeDriftDetector:
             "drift_count": self.drift_count,
             "drift_rate": f"{100 * self.drift_count / self.total_windows:.1f}%" if self.total_windows > 0 else "0.0%",
             "baseline_mean": self.baseline_mean,
-            "current_window_size": self.window.get_count()
+            "current_window_size": self.window.get_count(),
+            "alerts_dropped": self._dispatcher.dropped if self._dispatcher else 0
         }
 
 
-class PredictionLogMonitor(FileSystemEventHandler):
+class LogChangeWaiter:
+    """
+    Blocks until the log file changes or a timeout elapses.
+
+    Uses inotify (via ``inotify_simple``) on Linux and kqueue on BSD/macOS so
+    the monitor wakes as soon as data is appended instead of on a fixed tick.
+    Without either, ``wait`` simply sleeps for the timeout.
+    """
+
+    def __init__(self, log_file: Path):
+        """
+        Initialize the waiter.
+
+        Args:
+            log_file: Path to the prediction log file
+        """
+        self.log_file = Path(log_file)
+        self._inotify = None
+        self._kqueue = None
+        self._kq_fd: Optional[int] = None
+
+        if INotify is not None:
+            # Watch the directory so creation and rotation are seen too
+            self._inotify = INotify()
+            try:
+                self._inotify.add_watch(
+                    str(self.log_file.parent),
+                    inotify_flags.MODIFY | inotify_flags.CREATE | inotify_flags.MOVED_TO
+                )
+            except OSError:
+                # Directory does not exist (yet); wait() falls back to sleeping
+                self._inotify.close()
+                self._inotify = None
+        elif hasattr(select, "kqueue"):
+            self._kqueue = select.kqueue()
+
+    def _kqueue_register(self) -> bool:
+        """Register (or re-register) a vnode watch on the current log file."""
+        if self._kq_fd is not None:
+            os.close(self._kq_fd)
+            self._kq_fd = None
+        try:
+            self._kq_fd = os.open(self.log_file, os.O_RDONLY)
+        except FileNotFoundError:
+            return False
+
+        event = select.kevent(
+            self._kq_fd,
+            filter=select.KQ_FILTER_VNODE,
+            flags=select.KQ_EV_ADD | select.KQ_EV_CLEAR,
+            fflags=(select.KQ_NOTE_WRITE | select.KQ_NOTE_EXTEND
+                    | select.KQ_NOTE_DELETE | select.KQ_NOTE_RENAME)
+        )
+        self._kqueue.control([event], 0)
+        return True
+
+    def wait(self, timeout: float):
+        """Return once the log changes or after ``timeout`` seconds."""
+        if self._inotify is not None:
+            self._inotify.read(timeout=int(timeout * 1000))
+        elif self._kqueue is not None:
+            if self._kq_fd is None and not self._kqueue_register():
+                time.sleep(timeout)
+                return
+            for event in self._kqueue.control(None, 1, timeout):
+                if event.fflags & (select.KQ_NOTE_DELETE | select.KQ_NOTE_RENAME):
+                    # Rotated away; watch whichever file takes its place
+                    self._kqueue_register()
+        else:
+            time.sleep(timeout)
+
+    def close(self):
+        """Release the underlying inotify/kqueue resources."""
+        if self._inotify is not None:
+            self._inotify.close()
+            self._inotify = None
+        if self._kq_fd is not None:
+            os.close(self._kq_fd)
+            self._kq_fd = None
+        if self._kqueue is not None:
+            self._kqueue.close()
+            self._kqueue = None
+
+
+class PredictionLogMonitor:
     """
-    File system event handler for monitoring prediction log files.
+    Polling tailer for prediction log files.
     Tails the log file and processes new predictions in real-time.
     """
 
@@ -274,7 +603,6 @@ class PredictionLogMonitor(FileSystemEventHandler):
             verbose: If True, print detailed output
             from_beginning: If True, process existing predictions from start
         """
-        super().__init__()
         self.log_file = Path(log_file)
         self.drift_detector = drift_detector
         self.verbose = verbose
@@ -283,6 +611,13 @@ class PredictionLogMonitor(FileSystemEventHandler):
         self.file_position = 0
         self.file_inode = None
 
+        # Descriptor kept open across polls, plus any trailing partial line
+        self._fd: Optional[int] = None
+        self._pending = b""
+
+        # Alerts are printed off the ingest path
+        self._printer = AlertDispatcher(self._print_alert)
+
         # Initialize position
         if self.log_file.exists():
             if from_beginning:
@@ -290,52 +625,112 @@ class PredictionLogMonitor(FileSystemEventHandler):
                 self.file_position = 0
                 if self.verbose:
                     print(f"📖 Processing existing predictions from beginning...")
-                self._process_new_lines()  # Process existing content immediately
+                self._replay_existing()  # Process existing content immediately
             else:
                 # Normal tail behavior - only new predictions
                 self.file_position = self.log_file.stat().st_size
             self.file_inode = self.log_file.stat().st_ino
 
-    def on_modified(self, event: FileModifiedEvent):
-        """Handle file modification events."""
-        if event.is_directory:
-            return
-
-        # Check if it's our target file
-        if Path(event.src_path) == self.log_file:
-            self._process_new_lines()
+    def _open(self, position: int):
+        """(Re)open the log file descriptor positioned at ``position``."""
+        self._close_fd()
+        self._fd = os.open(self.log_file, os.O_RDONLY)
+        os.lseek(self._fd, position, os.SEEK_SET)
+        self.file_position = position
+        self._pending = b""
+
+    def _close_fd(self):
+        """Close the tailed file descriptor, if open."""
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    @property
+    def alerts_dropped(self) -> int:
+        """Stable-window alerts dropped because console output fell behind."""
+        return self._printer.dropped
+
+    def close(self):
+        """Close the tailed file descriptor and flush pending alert output."""
+        self._close_fd()
+        self._printer.close()
+
+    def _read_new_bytes(self) -> bytes:
+        """Read everything appended since the last poll with large binary reads."""
+        chunks = []
+        while True:
+            data = os.read(self._fd, READ_CHUNK_SIZE)
+            if not data:
+                break
+            chunks.append(data)
+        data = b"".join(chunks)
+        self.file_position += len(data)
+        return data
+
+    def _process_new_lines(self) -> int:
+        """
+        Read and process new lines from the log file.
 
-    def _process_new_lines(self):
-        """Read and process new lines from the log file."""
+        Returns:
+            Number of non-empty lines consumed (0 when nothing new was found)
+        """
+        processed = 0
         try:
-            # Check if file was rotated (new inode)
-            current_inode = self.log_file.stat().st_ino
-            if self.file_inode is not None and current_inode != self.file_inode:
+            # Check if file was rotated (new inode) or truncated in place
+            st = self.log_file.stat()
+            if self.file_inode is not None and st.st_ino != self.file_inode:
                 if self.verbose:
                     print(f"⚠️  Log file rotated, resetting position")
-                self.file_position = 0
-                self.file_inode = current_inode
+                self._open(0)
+                self.file_inode = st.st_ino
+            elif st.st_size < self.file_position:
+                if self.verbose:
+                    print(f"⚠️  Log file truncated, resetting position")
+                self._open(0)
+            elif self._fd is None:
+                self._open(self.file_position)
+            elif st.st_size == self.file_position:
+                # Nothing appended since the last poll; skip the read entirely
+                return 0
+
+            data = self._read_new_bytes()
+            if not data:
+                return 0
+
+            # Only complete lines are parsed; a partial final line waits for the next poll
+            lines = (self._pending + data).split(b"\n")
+            self._pending = lines.pop()
+            processed = self._consume_lines(lines)
 
-            with open(self.log_file, 'r') as f:
-                # Seek to last position
-                f.seek(self.file_position)
+        except FileNotFoundError:
+            if self.verbose:
+                print(f"⚠️  Log file not found: {self.log_file}")
+        except Exception as e:
+            if self.verbose:
+                print(f"⚠️  Error processing log: {e}")
 
-                # Read new lines
-                for line in f:
-                    line = line.strip()
-                    if line:
-                        try:
-                            prediction = json.loads(line)
-                            alert = self.drift_detector.process_prediction(prediction)
+        return processed
 
-                            if alert:
-                                self._print_alert(alert)
-                        except json.JSONDecodeError as e:
-                            if self.verbose:
-                                print(f"⚠️  Invalid JSON: {e}")
+    def _replay_existing(self) -> int:
+        """
+        Process the file's existing complete lines in one shot.
+
+        The file is memory-mapped and split once rather than read through the
+        polling path; tailing then resumes after the last complete line.
 
-                # Update position
-                self.file_position = f.tell()
+        Returns:
+            Number of non-empty lines consumed
+        """
+        try:
+            with open(self.log_file, "rb") as f:
+                if not os.fstat(f.fileno()).st_size:
+                    return 0
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    end = mm.rfind(b"\n") + 1
+                    lines = mm[:end].split(b"\n")
+
+            self.file_position = end
+            return self._consume_lines(lines)
 
         except FileNotFoundError:
             if self.verbose:
@@ -344,23 +739,69 @@ class PredictionLogMonitor(FileSystemEventHandler):
             if self.verbose:
                 print(f"⚠️  Error processing log: {e}")
 
+        return 0
+
+    def _consume_lines(self, lines: List[bytes]) -> int:
+        """
+        Parse complete JSONL lines and feed them to the detector in one batch.
+
+        Returns:
+            Number of non-empty lines consumed
+        """
+        processed = 0
+        values = []
+        timestamps = []
+        for line in lines:
+            line = line.strip()
+            if line:
+                processed += 1
+                try:
+                    prediction = json_loads(line)
+                    value = float(prediction["prediction"])
+                    timestamp = prediction.get("timestamp")
+                except json.JSONDecodeError as e:  # orjson's error subclasses this
+                    if self.verbose:
+                        print(f"⚠️  Invalid JSON: {e}")
+                    continue
+                except (KeyError, TypeError, ValueError) as e:
+                    # Skip only this record; the rest of the batch is still processed
+                    if self.verbose:
+                        print(f"⚠️  Invalid prediction record: {e!r}")
+                    continue
+                values.append(value)
+                timestamps.append(timestamp)
+
+        # Quiet mode only reports windows where drift was detected
+        for alert in self.drift_detector.process_batch(values, timestamps):
+            if self.verbose or alert.drift_detected:
+                self._printer.submit(alert)
+
+        return processed
+
     def _print_alert(self, alert: DriftAlert):
         """Print alert to console."""
-        print("\n" + "=" * 70)
+        rule = "=" * 70
         if alert.drift_detected:
-            print(f"🚨 DRIFT ALERT - Window {alert.window_id}")
+            title = f"🚨 DRIFT ALERT - Window {alert.window_id}"
         else:
-            print(f"✓ Window {alert.window_id} Complete")
-        print("=" * 70)
-        print(f"Timestamp:        {alert.timestamp}")
-        print(f"Status:           {'DRIFT DETECTED' if alert.drift_detected else 'STABLE'}")
-        print(f"Drift Statistic:  {alert.drift_statistic:.6f}")
-        print(f"Baseline Mean:    {alert.baseline_mean:.6f}")
-        print(f"Current Mean:     {alert.current_mean:.6f}")
-        print(f"Current Std:      {alert.current_std:.6f}")
-        print(f"Predictions:      {alert.predictions_in_window}")
-        print(f"\n{alert.alert_message}")
-        print("=" * 70 + "\n")
+            title = f"✓ Window {alert.window_id} Complete"
+
+        # Assemble the block and emit it with a single write
+        sys.stdout.write(
+            f"\n{rule}\n"
+            f"{title}\n"
+            f"{rule}\n"
+            f"Timestamp:        {alert.timestamp}\n"
+            f"Status:           {'DRIFT DETECTED' if alert.drift_detected else 'STABLE'}\n"
+            f"Drift Statistic:  {alert.drift_statistic:.6f}\n"
+            f"Baseline Mean:    {alert.baseline_mean:.6f}\n"
+            f"Current Mean:     {alert.current_mean:.6f}\n"
+            f"Current Std:      {alert.current_std:.6f}\n"
+            f"Predictions:      {alert.predictions_in_window}\n"
+            f"\n{alert.alert_message}\n"
+            f"{rule}\n\n"
+        )
+        sys.stdout.flush()
 
 
 class RealtimeDriftAnalyzer:
@@ -407,7 +848,7 @@ class RealtimeDriftAnalyzer:
             from_beginning=from_beginning
         )
 
-        self.observer = Observer()
+        self.waiter = LogChangeWaiter(log_file)
         self.running = False
 
         # Setup signal handlers for graceful shutdown
@@ -432,31 +873,28 @@ class RealtimeDriftAnalyzer:
         print("=" * 70)
         print("\n⏳ Waiting for predictions...\n")
 
-        # Setup file watching
-        watch_dir = self.log_file.parent
-        self.observer.schedule(self.monitor, str(watch_dir), recursive=False)
-        self.observer.start()
         self.running = True
 
-        # Keep running
+        # Block until the file changes (or the poll interval elapses as a
+        # fallback): re-check quickly while data keeps arriving, back off
+        # exponentially (up to MAX_POLL_INTERVAL) while it is idle
         try:
-            last_poll = time.time()
-            poll_interval = 2  # Check file every 2 seconds as fallback
+            poll_interval = MIN_POLL_INTERVAL
+            next_status_at = time.monotonic() + STATUS_INTERVAL
 
             while self.running:
-                time.sleep(0.5)
-
-                # Polling fallback - check file manually every poll_interval seconds
-                # This is needed because watchdog may not reliably detect all file changes on macOS
-                current_time = time.time()
-                if current_time - last_poll >= poll_interval:
-                    last_poll = current_time
-                    # Manually trigger file check
-                    self.monitor._process_new_lines()
-
-                # Print periodic status (every 60 seconds)
-                if self.verbose and int(time.time()) % 60 == 0:
-                    self._print_status()
+                if self.monitor._process_new_lines():
+                    poll_interval = MIN_POLL_INTERVAL
+                else:
+                    poll_interval = min(poll_interval * 2, MAX_POLL_INTERVAL)
+                self.waiter.wait(poll_interval)
+
+                # Print periodic status once per STATUS_INTERVAL
+                now = time.monotonic()
+                if now >= next_status_at:
+                    if self.verbose:
+                        self._print_status()
+                    next_status_at = now + STATUS_INTERVAL
 
         except KeyboardInterrupt:
             self.stop()
@@ -464,8 +902,9 @@ class RealtimeDriftAnalyzer:
     def stop(self):
         """Stop monitoring."""
         self.running = False
-        self.observer.stop()
-        self.observer.join()
+        self.monitor.close()
+        self.waiter.close()
+        self.drift_detector.close()
 
         # Print final summary
         self._print_summary()
@@ -495,6 +934,7 @@ class RealtimeDriftAnalyzer:
         print(f"Detection rate:        {summary['drift_rate']}")
         if summary['baseline_mean'] is not None:
             print(f"Baseline mean:         {summary['baseline_mean']:.6f}")
+        print(f"Alerts dropped:        {summary['alerts_dropped'] + self.monitor.alerts_dropped}")
         print("=" * 70)
 
 
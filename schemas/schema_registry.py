@@ -5,22 +5,156 @@ Provides JSON Schema validation for all data formats in the system.
 Supports versioned schemas with backward compatibility.
 """
 
+import io
 import json
+import mmap
 import os
+import pickle
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, Any, List, Optional
-from jsonschema import validate, ValidationError, Draft7Validator
+from typing import Dict, Any, Callable, Iterable, Iterator, List, Optional, Tuple
+from jsonschema import ValidationError, Draft7Validator
+
+try:
+    from orjson import loads as json_loads
+except ImportError:  # orjson is optional; stdlib json accepts the same input
+    from json import loads as json_loads
+
+try:
+    import zstandard
+except ImportError:  # zstandard is optional; only needed for .zst compressed logs
+    zstandard = None
+
+try:
+    import fastjsonschema
+except ImportError:  # fastjsonschema is optional; jsonschema validates the same schemas
+    fastjsonschema = None
+
+
+def _compile_validator(validator: Draft7Validator) -> Callable[[Any], None]:
+    """
+    Build a validation function for a schema, compiled once up front.
+
+    Uses fastjsonschema code generation when available, otherwise the given
+    (cached) Draft7Validator. Either way the function raises ``jsonschema.ValidationError``
+    (with ``message`` and ``path``) on invalid data. Format assertions and
+    default injection are disabled to match ``jsonschema.validate`` behavior.
+    """
+    if fastjsonschema is None:
+        return validator.validate
+
+    compiled = fastjsonschema.compile(validator.schema, use_default=False,
+                                      use_formats=False)
+
+    def check(data: Any) -> None:
+        try:
+            compiled(data)
+        except fastjsonschema.JsonSchemaValueException as e:
+            # fastjsonschema paths start with the root name ("data")
+            raise ValidationError(e.message, path=e.path[1:]) from None
+
+    return check
+
+
+def iter_jsonl_lines(file_path: Path) -> Iterator[bytes]:
+    """
+    Yield the raw lines of a JSONL file (without the newline) as bytes.
+
+    The file is memory-mapped and split with ``mmap.find``, avoiding the
+    per-line decode of text-mode iteration. Files ending in ``.zst`` are
+    stream-decompressed instead (all concatenated frames). Blank lines are
+    yielded too so callers can keep accurate line numbers; a final
+    unterminated line is included.
+    """
+    if Path(file_path).suffix == '.zst':
+        yield from _iter_zstd_lines(file_path)
+        return
+
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            start = 0
+            end = len(mm)
+            while start < end:
+                nl = mm.find(b'\n', start)
+                if nl < 0:
+                    nl = end
+                yield mm[start:nl]
+                start = nl + 1
+
+
+def _iter_zstd_lines(file_path: Path) -> Iterator[bytes]:
+    """Yield the lines of a zstd-compressed JSONL file (see iter_jsonl_lines)."""
+    if zstandard is None:
+        raise ImportError(f"zstandard is required to read compressed log {file_path}")
+    with open(file_path, 'rb') as f:
+        reader = zstandard.ZstdDecompressor().stream_reader(f, read_across_frames=True)
+        for line in io.BufferedReader(reader):
+            yield line[:-1] if line.endswith(b'\n') else line
+
+
+class DriftValidationError(ValidationError):
+    """
+    Schema validation failure raised by SchemaRegistry.
+
+    Carries the schema name, the underlying error message and the data path;
+    the full human-readable message is only formatted when it is read.
+    """
+
+    def __init__(self, schema_name: str, detail: str, path: Iterable[Any] = (),
+                 prefix: str = ''):
+        super().__init__(detail, path=path)
+        self.schema_name = schema_name
+        self.prefix = prefix
+
+    @property
+    def message(self) -> str:
+        return (
+            f"{self.prefix}Validation failed for schema '{self.schema_name}': "
+            f"{self.detail}\nPath: {' -> '.join(map(str, self.path))}"
+        )
+
+    @message.setter
+    def message(self, value: str) -> None:
+        # ValidationError.__init__ assigns the raw message here
+        self.detail = value
+
+
+# Default number of passed payloads remembered by SchemaRegistry.validate.
+# Off by default: prediction records carry unique timestamps, so the cache
+# would only add key-building cost to every call
+VALIDATION_CACHE_SIZE = 0
+
+
+def _payload_key(schema_name: str, data: Any) -> Optional[Tuple[str, bytes]]:
+    """
+    Build the validation cache key for data.
+
+    The pickled form keeps container types apart (a tuple never matches a
+    list) and is much cheaper to build than sorted-key JSON; payloads that
+    differ only in dict key order simply miss the cache. Returns None for
+    data that cannot be pickled, which is then always validated directly.
+    """
+    try:
+        return schema_name, pickle.dumps(data, pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, TypeError, AttributeError):
+        return None
 
 
 class SchemaRegistry:
     """Central registry for JSON schemas with validation utilities."""
 
-    def __init__(self, schema_dir: Optional[Path] = None):
+    def __init__(self, schema_dir: Optional[Path] = None,
+                 cache_size: int = VALIDATION_CACHE_SIZE):
         """
         Initialize the schema registry.
 
         Args:
             schema_dir: Directory containing schema files. If None, uses default location.
+            cache_size: Number of recently passed payloads remembered by validate()
+                so identical records skip re-validation (0, the default, disables
+                the cache; only worth enabling for repeated payloads)
         """
         if schema_dir is None:
             # Default to schemas/ directory relative to this file
@@ -28,11 +162,22 @@ class SchemaRegistry:
         else:
             self.schema_dir = Path(schema_dir)
 
+        self._schema_paths: Dict[str, Path] = {}
         self._schemas: Dict[str, Dict[str, Any]] = {}
+        self._validators: Dict[str, Draft7Validator] = {}
+        self._compiled: Dict[str, Callable[[Any], None]] = {}
+        self._cache_size = cache_size
+        self._validation_cache: "OrderedDict[Tuple[str, bytes], bool]" = OrderedDict()
+        # (path, schema, is_jsonl) -> file signature at its last successful validation
+        self._file_cache: Dict[Tuple[str, str, bool], Tuple[int, int, int]] = {}
         self._load_schemas()
 
     def _load_schemas(self):
-        """Load all schema files from the schema directory."""
+        """
+        Locate the schema files in the schema directory.
+
+        Files are only read and compiled on first use (see get_schema).
+        """
         schema_files = {
             'prediction': 'prediction_v1.json',
             'window_metadata': 'window_metadata_v1.json',
@@ -43,11 +188,21 @@ class SchemaRegistry:
         for schema_name, filename in schema_files.items():
             schema_path = self.schema_dir / filename
             if schema_path.exists():
-                with open(schema_path, 'r') as f:
-                    self._schemas[schema_name] = json.load(f)
+                self._schema_paths[schema_name] = schema_path
             else:
                 print(f"Warning: Schema file not found: {schema_path}")
 
+    def _load_schema(self, schema_name: str) -> Dict[str, Any]:
+        """Read, check and compile one schema file, caching the results."""
+        with open(self._schema_paths[schema_name], 'r') as f:
+            schema = json.load(f)
+        Draft7Validator.check_schema(schema)
+        validator = Draft7Validator(schema)
+        self._schemas[schema_name] = schema
+        self._validators[schema_name] = validator
+        self._compiled[schema_name] = _compile_validator(validator)
+        return schema
+
     def get_schema(self, schema_name: str) -> Dict[str, Any]:
         """
         Get a schema by name.
@@ -61,9 +216,20 @@ class SchemaRegistry:
         Raises:
             KeyError: If schema not found
         """
-        if schema_name not in self._schemas:
-            raise KeyError(f"Schema '{schema_name}' not found. Available: {list(self._schemas.keys())}")
-        return self._schemas[schema_name]
+        schema = self._schemas.get(schema_name)
+        if schema is not None:
+            return schema
+        if schema_name not in self._schema_paths:
+            raise KeyError(f"Schema '{schema_name}' not found. Available: {self.list_schemas()}")
+        return self._load_schema(schema_name)
+
+    def _get_compiled(self, schema_name: str) -> Callable[[Any], None]:
+        """Return the compiled validation function for a schema (KeyError if unknown)."""
+        compiled = self._compiled.get(schema_name)
+        if compiled is None:
+            self.get_schema(schema_name)
+            compiled = self._compiled[schema_name]
+        return compiled
 
     def validate(self, data: Any, schema_name: str, raise_error: bool = True) -> bool:
         """
@@ -81,26 +247,38 @@ class SchemaRegistry:
             ValidationError: If validation fails and raise_error=True
             KeyError: If schema not found
         """
-        schema = self.get_schema(schema_name)
+        check = self._get_compiled(schema_name)
 
-        try:
-            validate(instance=data, schema=schema)
+        # Only passing results are cached, so failures always get a fresh error
+        cache = self._validation_cache
+        key = _payload_key(schema_name, data) if self._cache_size > 0 else None
+        if key is not None and key in cache:
+            cache.move_to_end(key)
             return True
+
+        try:
+            check(data)
         except ValidationError as e:
             if raise_error:
-                raise ValidationError(
-                    f"Validation failed for schema '{schema_name}': {e.message}\n"
-                    f"Path: {' -> '.join(str(p) for p in e.path)}"
-                ) from e
+                raise DriftValidationError(schema_name, e.message, e.path) from e
             return False
 
-    def validate_list(self, data_list: List[Dict[str, Any]], schema_name: str,
+        if key is not None:
+            cache[key] = True
+            if len(cache) > self._cache_size:
+                cache.popitem(last=False)
+        return True
+
+    def validate_list(self, data_list: Iterable[Dict[str, Any]], schema_name: str,
                      raise_error: bool = True) -> bool:
         """
-        Validate a list of data items against a schema.
+        Validate a list (or any iterable) of data items against a schema.
+
+        Items are consumed one at a time, so a generator is validated without
+        being materialized.
 
         Args:
-            data_list: List of data items to validate
+            data_list: Data items to validate
             schema_name: Name of the schema to validate against
             raise_error: If True, raises ValidationError on failure
 
@@ -110,22 +288,49 @@ class SchemaRegistry:
         Raises:
             ValidationError: If any item fails validation and raise_error=True
         """
+        # Resolve the compiled validator once, then run it over every item
+        check = self._get_compiled(schema_name)
         for i, item in enumerate(data_list):
             try:
-                self.validate(item, schema_name, raise_error=True)
+                check(item)
             except ValidationError as e:
                 if raise_error:
-                    raise ValidationError(
-                        f"Validation failed for item {i} in list: {e.message}"
+                    raise DriftValidationError(
+                        schema_name, e.message, e.path,
+                        prefix=f"Validation failed for item {i} in list: "
                     ) from e
                 return False
         return True
 
+    @staticmethod
+    def file_signature(file_path: Path) -> Tuple[int, int, int]:
+        """Return an (inode, mtime_ns, size) tuple that changes when a file is modified."""
+        st = os.stat(file_path)
+        return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+    def is_known_valid(self, file_path: Path, schema_name: str,
+                       is_jsonl: bool = False) -> bool:
+        """Check whether a file passed validation and has not changed since."""
+        key = (str(file_path), schema_name, is_jsonl)
+        signature = self._file_cache.get(key)
+        try:
+            return signature is not None and signature == self.file_signature(file_path)
+        except OSError:
+            return False
+
+    def mark_valid(self, file_path: Path, schema_name: str, is_jsonl: bool,
+                   signature: Tuple[int, int, int]) -> None:
+        """Record that a file with the given signature passed validation."""
+        self._file_cache[(str(file_path), schema_name, is_jsonl)] = signature
+
     def validate_file(self, file_path: Path, schema_name: str,
                      is_jsonl: bool = False, raise_error: bool = True) -> bool:
         """
         Validate a JSON or JSONL file against a schema.
 
+        Files that passed before and are unchanged since (same inode, mtime and
+        size) are not read again.
+
         Args:
             file_path: Path to the file to validate
             schema_name: Name of the schema to validate against
@@ -142,24 +347,44 @@ class SchemaRegistry:
         if not file_path.exists():
             raise FileNotFoundError(f"File not found: {file_path}")
 
+        if self.is_known_valid(file_path, schema_name, is_jsonl):
+            return True
+
+        # Taken before reading, so a write during validation invalidates the entry
+        signature = self.file_signature(file_path)
+        valid = self._validate_file_contents(file_path, schema_name, is_jsonl, raise_error)
+        if valid:
+            self.mark_valid(file_path, schema_name, is_jsonl, signature)
+        return valid
+
+    def _validate_file_contents(self, file_path: Path, schema_name: str,
+                                is_jsonl: bool, raise_error: bool) -> bool:
+        """Parse and validate a file's contents (see validate_file)."""
         if is_jsonl:
             # Validate JSONL format (predictions log)
-            with open(file_path, 'r') as f:
-                for line_num, line in enumerate(f, 1):
-                    if line.strip():  # Skip empty lines
-                        try:
-                            data = json.loads(line)
-                            self.validate(data, schema_name, raise_error=True)
-                        except (json.JSONDecodeError, ValidationError) as e:
-                            if raise_error:
-                                raise ValidationError(
-                                    f"Validation failed at line {line_num}: {str(e)}"
-                                ) from e
-                            return False
+            # Parse and check one line at a time so no records are retained
+            check = self._get_compiled(schema_name)
+            for line_num, line in enumerate(iter_jsonl_lines(file_path), 1):
+                if line.strip():  # Skip empty lines
+                    try:
+                        check(json_loads(line))
+                    except json.JSONDecodeError as e:
+                        if raise_error:
+                            raise ValidationError(
+                                f"Validation failed at line {line_num}: {str(e)}"
+                            ) from e
+                        return False
+                    except ValidationError as e:
+                        if raise_error:
+                            raise DriftValidationError(
+                                schema_name, e.message, e.path,
+                                prefix=f"Validation failed at line {line_num}: "
+                            ) from e
+                        return False
         else:
             # Validate regular JSON format
-            with open(file_path, 'r') as f:
-                data = json.load(f)
+            with open(file_path, 'rb') as f:
+                data = json_loads(f.read())
 
             # Handle both single objects and arrays
             if isinstance(data, list):
@@ -171,7 +396,10 @@ class SchemaRegistry:
 
     def get_validator(self, schema_name: str) -> Draft7Validator:
         """
-        Get a Draft7Validator for a schema.
+        Get the Draft7Validator for a schema.
+
+        Validators are built once when schemas are loaded and shared by all
+        callers.
 
         Args:
             schema_name: Name of the schema
@@ -179,8 +407,8 @@ class SchemaRegistry:
         Returns:
             A configured Draft7Validator instance
         """
-        schema = self.get_schema(schema_name)
-        return Draft7Validator(schema)
+        self.get_schema(schema_name)
+        return self._validators[schema_name]
 
     def list_schemas(self) -> List[str]:
         """
@@ -189,7 +417,7 @@ class SchemaRegistry:
         Returns:
             List of schema names
         """
-        return list(self._schemas.keys())
+        return list(self._schema_paths.keys())
 
 
 # Global schema registry instance
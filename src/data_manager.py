@@ -5,17 +5,128 @@ Provides unified, schema-validated data operations for all system components.
 Handles reading and writing predictions, window metadata, and drift detection results.
 """
 
+import atexit
 import json
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Sequence, Tuple
 from datetime import datetime
 import tempfile
-import shutil
-
-# Import schema validation
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+try:
+    import orjson
+    from orjson import loads as json_loads
+except ImportError:  # orjson is optional; stdlib json reads and writes the same data
+    orjson = None
+    from json import loads as json_loads
+
+try:
+    import zstandard
+except ImportError:  # zstandard is optional; only needed for .zst compressed logs
+    zstandard = None
+
+try:
+    import simdjson
+except ImportError:  # pysimdjson is optional; projected reads fall back to full parsing
+    simdjson = None
+
+# Write buffer size for kept-open prediction logs
+LOG_BUFFER_SIZE = 1 << 20
+
+# Compression level for .jsonl.zst prediction logs
+ZSTD_LEVEL = 3
+
+# Input feature names, in the column order used by read_predictions_columnar
+FEATURE_NAMES = ('feature1', 'feature2', 'feature3')
+
+# Fixed-shape JSONL record written by DataManager.append_prediction_fast; key
+# order matches the dicts built by the model service. Floats are written with
+# repr, so lines decode to the same record as append_prediction's but are not
+# always byte-identical to orjson output (e.g. 1e+16 vs 1e16)
+_PREDICTION_LINE = (
+    b'{"timestamp":%s,"input_features":{"feature1":%a,"feature2":%a,'
+    b'"feature3":%a},"prediction":%a,"model_version":%s,"drift_phase":%d}\n'
+)
+
+# Import schema validation. schemas/ is not a package, so load the module from
+# its file once (reusing it if already imported) instead of extending sys.path
+import importlib.util
 import sys
-sys.path.append(str(Path(__file__).parent.parent / 'schemas'))
-from schema_registry import get_registry, ValidationError
+
+
+def _load_schema_registry():
+    module = sys.modules.get('schema_registry')
+    if module is None:
+        path = Path(__file__).parent.parent / 'schemas' / 'schema_registry.py'
+        spec = importlib.util.spec_from_file_location('schema_registry', path)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules['schema_registry'] = module
+        try:
+            spec.loader.exec_module(module)
+        except BaseException:
+            del sys.modules['schema_registry']
+            raise
+    return module
+
+
+_schema_registry = _load_schema_registry()
+get_registry = _schema_registry.get_registry
+iter_jsonl_lines = _schema_registry.iter_jsonl_lines
+DriftValidationError = _schema_registry.DriftValidationError
+ValidationError = _schema_registry.ValidationError
+
+
+def json_dumps(obj: Any, indent: bool = False) -> bytes:
+    """
+    Serialize an object to UTF-8 JSON bytes, using orjson when installed.
+
+    Args:
+        obj: JSON-compatible object (numpy scalars are accepted)
+        indent: If True, pretty-print with a 2-space indent
+
+    Returns:
+        Encoded JSON document
+    """
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_NUMPY
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, indent=2 if indent else None).encode()
+
+
+class _ZstdLogWriter:
+    """
+    Append-only writer for zstd-compressed prediction logs.
+
+    Every flush ends the current zstd frame, so the file on disk is always a
+    sequence of complete frames that decodes up to the last flushed record.
+    """
+
+    def __init__(self, log_file: Path):
+        if zstandard is None:
+            raise ImportError(f"zstandard is required to write compressed log {log_file}")
+        self._file = open(log_file, 'ab', buffering=LOG_BUFFER_SIZE)
+        compressor = zstandard.ZstdCompressor(level=ZSTD_LEVEL)
+        self._stream = compressor.stream_writer(self._file, closefd=False)
+        self._pending = False
+
+    def write(self, data: bytes) -> None:
+        self._stream.write(data)
+        self._pending = True
+
+    def flush(self) -> None:
+        if self._pending:
+            self._stream.flush(zstandard.FLUSH_FRAME)
+            self._pending = False
+        self._file.flush()
+
+    def close(self) -> None:
+        self.flush()
+        self._file.close()
 
 
 class DataManager:
@@ -34,6 +145,40 @@ class DataManager:
         """
         self.validate = validate
         self.registry = get_registry() if validate else None
+        self._open_logs: Dict[Path, Any] = {}
+
+    def __enter__(self) -> 'DataManager':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _log_writer(self, log_file: Path) -> Any:
+        """Return the buffered writer for a prediction log, opening it on first use."""
+        writer = self._open_logs.get(log_file)
+        if writer is None:
+            log_file.parent.mkdir(parents=True, exist_ok=True)
+            if log_file.suffix == '.zst':
+                writer = _ZstdLogWriter(log_file)
+            else:
+                writer = open(log_file, 'ab', buffering=LOG_BUFFER_SIZE)
+            if not self._open_logs:
+                atexit.register(self.close)
+            self._open_logs[log_file] = writer
+        return writer
+
+    def flush(self) -> None:
+        """Flush buffered prediction log writes to disk."""
+        for writer in self._open_logs.values():
+            writer.flush()
+
+    def close(self) -> None:
+        """Flush and close all prediction logs kept open by append_prediction."""
+        for writer in self._open_logs.values():
+            writer.close()
+        if self._open_logs:
+            atexit.unregister(self.close)
+        self._open_logs.clear()
 
     # ==================== Prediction Operations ====================
 
@@ -42,6 +187,10 @@ class DataManager:
         """
         Append a prediction to a JSONL log file.
 
+        The log is kept open with a write buffer; call flush() or close() (or
+        use the manager as a context manager) to make the writes visible to
+        other readers. Reads through this manager flush automatically.
+
         Args:
             log_file: Path to the JSONL log file
             prediction: Prediction dictionary
@@ -55,22 +204,93 @@ class DataManager:
         if should_validate:
             self.registry.validate(prediction, 'prediction')
 
-        # Append to JSONL file
-        log_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(log_file, 'a') as f:
-            f.write(json.dumps(prediction) + '\n')
+        self._log_writer(log_file).write(json_dumps(prediction) + b'\n')
 
-    def read_predictions(self, log_file: Path,
-                        validate: Optional[bool] = None) -> List[Dict[str, Any]]:
+    def append_prediction_fast(self, log_file: Path, timestamp: str,
+                               features: Sequence[float], prediction: float,
+                               model_version: str, drift_phase: int = 1,
+                               validate: Optional[bool] = None) -> None:
         """
-        Read predictions from a JSONL log file.
+        Append a standard three-feature prediction without building a dict.
+
+        The line is rendered from a precomputed template, which skips general
+        JSON serialization. All numeric values must be finite. When validation
+        is enabled the equivalent dict is still built and checked.
 
         Args:
             log_file: Path to the JSONL log file
+            timestamp: ISO format timestamp
+            features: Values of feature1, feature2 and feature3 (e.g. a numpy row)
+            prediction: Model prediction value
+            model_version: Version of the model used
+            drift_phase: Drift phase ID
             validate: Override instance validation setting
 
-        Returns:
-            List of prediction dictionaries
+        Raises:
+            ValidationError: If validation fails
+        """
+        f1, f2, f3 = map(float, features)
+        prediction = float(prediction)
+
+        should_validate = validate if validate is not None else self.validate
+
+        if should_validate:
+            self.registry.validate({
+                'timestamp': timestamp,
+                'input_features': {'feature1': f1, 'feature2': f2, 'feature3': f3},
+                'prediction': prediction,
+                'model_version': model_version,
+                'drift_phase': drift_phase,
+            }, 'prediction')
+
+        line = _PREDICTION_LINE % (json_dumps(timestamp), f1, f2, f3, prediction,
+                                   json_dumps(model_version), drift_phase)
+        self._log_writer(log_file).write(line)
+
+    def append_predictions(self, log_file: Path,
+                           predictions: Iterable[Dict[str, Any]],
+                           validate: Optional[bool] = None) -> None:
+        """
+        Append a batch of predictions to a JSONL log file in a single write.
+
+        Args:
+            log_file: Path to the JSONL log file
+            predictions: Prediction dictionaries
+            validate: Override instance validation setting
+
+        Raises:
+            ValidationError: If validation fails (nothing is written)
+        """
+        predictions = list(predictions)
+        if not predictions:
+            return
+
+        should_validate = validate if validate is not None else self.validate
+
+        if should_validate:
+            self.registry.validate_list(predictions, 'prediction')
+
+        payload = b'\n'.join(json_dumps(p) for p in predictions) + b'\n'
+        self._log_writer(log_file).write(payload)
+
+    def iter_predictions(self, log_file: Path,
+                         validate: Optional[bool] = None,
+                         keys: Optional[List[str]] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Stream predictions from a JSONL log file, one record at a time.
+
+        Each line is parsed and validated before the next one is read, so
+        memory use does not grow with the size of the log.
+
+        Args:
+            log_file: Path to the JSONL log file
+            validate: Override instance validation setting
+            keys: If given, only these top-level fields are returned for each
+                record (missing fields are omitted). Validation, when enabled,
+                still checks the full record.
+
+        Yields:
+            Prediction dictionaries
 
         Raises:
             FileNotFoundError: If log file doesn't exist
@@ -79,23 +299,124 @@ class DataManager:
         if not log_file.exists():
             raise FileNotFoundError(f"Log file not found: {log_file}")
 
-        predictions = []
-        with open(log_file, 'r') as f:
-            for line in f:
-                if line.strip():
-                    predictions.append(json.loads(line))
+        writer = self._open_logs.get(log_file)
+        if writer is not None:
+            writer.flush()
 
         should_validate = validate if validate is not None else self.validate
+
+        lines = (line for line in iter_jsonl_lines(log_file) if line.strip())
+        if keys is not None and not should_validate and simdjson is not None:
+            yield from self._iter_projected(lines, keys)
+            return
+
+        # Pick the per-record loop once rather than branching on every line
         if should_validate:
-            self.registry.validate_list(predictions, 'prediction')
+            records = self._iter_validated(lines)
+        else:
+            records = map(json_loads, lines)
+
+        if keys is None:
+            yield from records
+        else:
+            for prediction in records:
+                yield {k: prediction[k] for k in keys if k in prediction}
+
+    def _iter_validated(self, lines: Iterator[bytes]) -> Iterator[Dict[str, Any]]:
+        """Parse lines and validate each record against the prediction schema."""
+        check = self.registry.validate
+        for i, line in enumerate(lines):
+            prediction = json_loads(line)
+            try:
+                check(prediction, 'prediction')
+            except DriftValidationError as e:
+                raise DriftValidationError(
+                    e.schema_name, e.detail, e.path,
+                    prefix=f"Validation failed for item {i} in list: "
+                ) from e
+            yield prediction
+
+    @staticmethod
+    def _iter_projected(lines: Iterator[bytes],
+                        keys: List[str]) -> Iterator[Dict[str, Any]]:
+        """Parse lines lazily with simdjson, materializing only the requested keys."""
+        parser = simdjson.Parser()
+        for line in lines:
+            doc = parser.parse(line)
+            row = {}
+            for k in keys:
+                if k in doc:
+                    value = doc[k]
+                    if isinstance(value, simdjson.Object):
+                        value = value.as_dict()
+                    elif isinstance(value, simdjson.Array):
+                        value = value.as_list()
+                    row[k] = value
+            # The parser can only be reused once no document proxies are alive
+            doc = value = None
+            yield row
+
+    def read_predictions(self, log_file: Path,
+                        validate: Optional[bool] = None,
+                        keys: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """
+        Read predictions from a JSONL log file.
+
+        Args:
+            log_file: Path to the JSONL log file
+            validate: Override instance validation setting
+            keys: If given, only these top-level fields are returned per record
+
+        Returns:
+            List of prediction dictionaries
+
+        Raises:
+            FileNotFoundError: If log file doesn't exist
+            ValidationError: If validation fails
+        """
+        return list(self.iter_predictions(log_file, validate, keys))
 
-        return predictions
+    def read_predictions_columnar(self, log_file: Path,
+                                  validate: Optional[bool] = None) -> Dict[str, Any]:
+        """
+        Read predictions from a JSONL log file into per-field columns.
+
+        Args:
+            log_file: Path to the JSONL log file
+            validate: Override instance validation setting
+
+        Returns:
+            Dictionary with 'timestamp' (list of str), 'prediction' (float64
+            array), 'drift_phase' (int32 array, 0 where absent) and
+            'input_features' (float64 array of shape (N, len(FEATURE_NAMES)))
+
+        Raises:
+            FileNotFoundError: If log file doesn't exist
+            ValidationError: If validation fails
+        """
+        keys = ['timestamp', 'prediction', 'drift_phase', 'input_features']
+        timestamps, predictions, phases, features = [], [], [], []
+        for record in self.iter_predictions(log_file, validate, keys):
+            timestamps.append(record['timestamp'])
+            predictions.append(record['prediction'])
+            phases.append(record.get('drift_phase', 0))
+            row = record['input_features']
+            features.append([row[name] for name in FEATURE_NAMES])
+
+        return {
+            'timestamp': timestamps,
+            'prediction': np.array(predictions, dtype=np.float64),
+            'drift_phase': np.array(phases, dtype=np.int32),
+            'input_features': np.array(features, dtype=np.float64).reshape(
+                -1, len(FEATURE_NAMES)),
+        }
 
     # ==================== Window Metadata Operations ====================
 
     def write_window_metadata(self, output_file: Path,
                              windows: List[Dict[str, Any]],
-                             validate: Optional[bool] = None) -> None:
+                             validate: Optional[bool] = None,
+                             pretty: bool = False) -> None:
         """
         Write window metadata to a JSON file.
 
@@ -103,6 +424,7 @@ class DataManager:
             output_file: Path to the output JSON file
             windows: List of window metadata dictionaries
             validate: Override instance validation setting
+            pretty: If True, indent the JSON output for human reading
 
         Raises:
             ValidationError: If validation fails
@@ -114,13 +436,13 @@ class DataManager:
 
         # Atomic write: write to temp file, then rename
         output_file.parent.mkdir(parents=True, exist_ok=True)
-        with tempfile.NamedTemporaryFile(mode='w', delete=False,
+        with tempfile.NamedTemporaryFile(mode='wb', delete=False,
                                         dir=output_file.parent,
                                         suffix='.tmp') as tmp_file:
-            json.dump(windows, tmp_file, indent=2)
+            tmp_file.write(json_dumps(windows, indent=pretty))
             tmp_path = tmp_file.name
 
-        shutil.move(tmp_path, output_file)
+        os.replace(tmp_path, output_file)
 
     def read_window_metadata(self, metadata_file: Path,
                             validate: Optional[bool] = None) -> List[Dict[str, Any]]:
@@ -141,8 +463,8 @@ class DataManager:
         if not metadata_file.exists():
             raise FileNotFoundError(f"Metadata file not found: {metadata_file}")
 
-        with open(metadata_file, 'r') as f:
-            windows = json.load(f)
+        with open(metadata_file, 'rb') as f:
+            windows = json_loads(f.read())
 
         should_validate = validate if validate is not None else self.validate
         if should_validate:
@@ -154,7 +476,8 @@ class DataManager:
 
     def write_drift_detections(self, output_file: Path,
                               detections: List[Dict[str, Any]],
-                              validate: Optional[bool] = None) -> None:
+                              validate: Optional[bool] = None,
+                              pretty: bool = False) -> None:
         """
         Write drift detection results to a JSON file.
 
@@ -162,6 +485,7 @@ class DataManager:
             output_file: Path to the output JSON file
             detections: List of drift detection dictionaries
             validate: Override instance validation setting
+            pretty: If True, indent the JSON output for human reading
 
         Raises:
             ValidationError: If validation fails
@@ -173,13 +497,13 @@ class DataManager:
 
         # Atomic write: write to temp file, then rename
         output_file.parent.mkdir(parents=True, exist_ok=True)
-        with tempfile.NamedTemporaryFile(mode='w', delete=False,
+        with tempfile.NamedTemporaryFile(mode='wb', delete=False,
                                         dir=output_file.parent,
                                         suffix='.tmp') as tmp_file:
-            json.dump(detections, tmp_file, indent=2)
+            tmp_file.write(json_dumps(detections, indent=pretty))
             tmp_path = tmp_file.name
 
-        shutil.move(tmp_path, output_file)
+        os.replace(tmp_path, output_file)
 
     def read_drift_detections(self, detection_file: Path,
                              validate: Optional[bool] = None) -> List[Dict[str, Any]]:
@@ -200,8 +524,8 @@ class DataManager:
         if not detection_file.exists():
             raise FileNotFoundError(f"Detection file not found: {detection_file}")
 
-        with open(detection_file, 'r') as f:
-            detections = json.load(f)
+        with open(detection_file, 'rb') as f:
+            detections = json_loads(f.read())
 
         should_validate = validate if validate is not None else self.validate
         if should_validate:
@@ -230,8 +554,8 @@ class DataManager:
         if not config_file.exists():
             raise FileNotFoundError(f"Config file not found: {config_file}")
 
-        with open(config_file, 'r') as f:
-            config = json.load(f)
+        with open(config_file, 'rb') as f:
+            config = json_loads(f.read())
 
         should_validate = validate if validate is not None else self.validate
         if should_validate:
@@ -242,13 +566,15 @@ class DataManager:
     # ==================== Utility Methods ====================
 
     def get_prediction_log_path(self, date: Optional[datetime] = None,
-                               logs_dir: Path = None) -> Path:
+                               logs_dir: Path = None,
+                               compressed: bool = False) -> Path:
         """
         Get the standard path for a prediction log file.
 
         Args:
             date: Date for the log file (defaults to today)
             logs_dir: Directory for logs (defaults to ./logs)
+            compressed: If True, return a zstd-compressed ``.jsonl.zst`` path
 
         Returns:
             Path to the log file
@@ -259,78 +585,95 @@ class DataManager:
             logs_dir = Path(__file__).parent.parent / 'logs'
 
         filename = f"predictions_{date.strftime('%Y%m%d')}.jsonl"
+        if compressed:
+            filename += '.zst'
         return logs_dir / filename
 
-    def validate_existing_files(self, verbose: bool = True) -> Dict[str, bool]:
+    def validate_existing_files(self, verbose: bool = True,
+                                workers: Optional[int] = None) -> Dict[str, bool]:
         """
         Validate all existing data files in standard locations.
 
+        Files are validated concurrently in a process pool when there is more
+        than one of them.
+
         Args:
             verbose: If True, prints validation results
+            workers: Number of worker processes (defaults to the CPU count)
 
         Returns:
             Dictionary mapping file paths to validation status
         """
         base_dir = Path(__file__).parent.parent
-        results = {}
+        jobs = []
 
         # Check prediction logs
         logs_dir = base_dir / 'logs'
         if logs_dir.exists():
-            for log_file in logs_dir.glob('predictions_*.jsonl'):
-                try:
-                    self.registry.validate_file(log_file, 'prediction', is_jsonl=True)
-                    results[str(log_file)] = True
-                    if verbose:
-                        print(f"✓ {log_file.name}")
-                except Exception as e:
-                    results[str(log_file)] = False
-                    if verbose:
-                        print(f"✗ {log_file.name}: {str(e)}")
+            for pattern in ('predictions_*.jsonl', 'predictions_*.jsonl.zst'):
+                for log_file in logs_dir.glob(pattern):
+                    jobs.append((log_file, 'prediction', True))
 
         # Check window metadata
         metadata_file = base_dir / 'outputs' / 'metadata' / 'window_metadata.json'
         if metadata_file.exists():
-            try:
-                self.registry.validate_file(metadata_file, 'window_metadata')
-                results[str(metadata_file)] = True
-                if verbose:
-                    print(f"✓ {metadata_file.name}")
-            except Exception as e:
-                results[str(metadata_file)] = False
-                if verbose:
-                    print(f"✗ {metadata_file.name}: {str(e)}")
+            jobs.append((metadata_file, 'window_metadata', False))
 
         # Check drift detection results
         detection_file = base_dir / 'outputs' / 'detection' / 'drift_detection.json'
         if detection_file.exists():
-            try:
-                self.registry.validate_file(detection_file, 'drift_detection')
-                results[str(detection_file)] = True
-                if verbose:
-                    print(f"✓ {detection_file.name}")
-            except Exception as e:
-                results[str(detection_file)] = False
-                if verbose:
-                    print(f"✗ {detection_file.name}: {str(e)}")
+            jobs.append((detection_file, 'drift_detection', False))
 
         # Check config files
         configs_dir = base_dir / 'configs'
         if configs_dir.exists():
             for config_file in configs_dir.glob('config_*.json'):
-                try:
-                    self.registry.validate_file(config_file, 'config')
-                    results[str(config_file)] = True
-                    if verbose:
-                        print(f"✓ {config_file.name}")
-                except Exception as e:
-                    results[str(config_file)] = False
-                    if verbose:
-                        print(f"✗ {config_file.name}: {str(e)}")
+                jobs.append((config_file, 'config', False))
+
+        # Files unchanged since they last passed are not revalidated
+        registry = get_registry()
+        pending = [job for job in jobs if not registry.is_known_valid(*job)]
+
+        if len(pending) > 1 and (workers is None or workers > 1):
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                outcomes = list(pool.map(_validate_file_worker, *zip(*pending)))
+        else:
+            outcomes = [_validate_file_worker(*job) for job in pending]
+
+        errors = dict.fromkeys(job[0] for job in jobs)
+        for job, (error, signature) in zip(pending, outcomes):
+            errors[job[0]] = error
+            if error is None:
+                registry.mark_valid(*job, signature)
+
+        results = {}
+        for path, error in errors.items():
+            results[str(path)] = error is None
+            if verbose:
+                if error is None:
+                    print(f"✓ {path.name}")
+                else:
+                    print(f"✗ {path.name}: {error}")
 
         return results
 
 
+def _validate_file_worker(file_path: Path, schema_name: str,
+                          is_jsonl: bool) -> Tuple[Optional[str], Optional[Tuple[int, int, int]]]:
+    """
+    Validate one file in a worker process.
+
+    Returns the error message (None on success) and the file signature taken
+    before validation, for the caller's cache.
+    """
+    registry = get_registry()
+    try:
+        signature = registry.file_signature(file_path)
+        registry.validate_file(file_path, schema_name, is_jsonl=is_jsonl)
+    except Exception as e:
+        return str(e), None
+    return None, signature
+
 if __name__ == "__main__":
     # Demo: validate existing data files
     print("=" * 60)
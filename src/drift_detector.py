@@ -2,36 +2,253 @@
 Drift Detection Engine for Epic 3: Drift Detection Engine
 Uses ADWIN algorithm to detect drift in prediction streams.
 """
+import gc
 import json
+import math
+import mmap
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import List, Dict, Iterator, Optional, Tuple
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 from river.drift import ADWIN
 
+try:
+    import orjson
+    from orjson import loads as json_loads
+except ImportError:  # orjson is optional; stdlib json reads and writes the same data
+    orjson = None
+    from json import loads as json_loads
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:  # numba is optional; the JIT ADWIN scan is only used with it
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+# Float fields of a detection result, rounded to RESULT_DECIMALS when saved
+ROUNDED_FIELDS = ("drift_statistic", "baseline_mean", "current_mean", "current_std")
+RESULT_DECIMALS = 6
+
+# Rows of the ADWIN exponential histogram (row i holds buckets of 2**i samples)
+MAX_BUCKET_ROWS = 64
+
+# Samples preceding each chunk that a parallel scan replays to warm up ADWIN
+RECONCILE_SAMPLES = 1000
+
+
+@njit
+def _drop_buckets(totals, variances, sizes, row, n):
+    """Remove the n oldest buckets of a histogram row."""
+    width = totals.shape[1]
+    for i in range(n, width):
+        totals[row, i - n] = totals[row, i]
+        variances[row, i - n] = variances[row, i]
+    for i in range(width - n, width):
+        totals[row, i] = 0.0
+        variances[row, i] = 0.0
+    sizes[row] -= n
+
+
+@njit
+def adwin_scan(values, delta=0.002, clock=32, max_buckets=5,
+               min_window_length=5, grace_period=10):
+    """
+    Run ADWIN over a stream of values in one compiled loop.
+
+    A port of river's ADWIN (same parameters and defaults): the result matches
+    calling ``ADWIN.update`` on each value of a fresh detector, without a
+    Python-level call per sample.
+
+    Args:
+        values: 1-D float64 array of observations, in stream order
+        delta: Confidence value
+        clock: How often (in samples) to check for change
+        max_buckets: Buckets of each size kept before merging
+        min_window_length: Minimum length of each subwindow
+        grace_period: Samples required before checking for change
+
+    Returns:
+        Boolean array, True where ADWIN reports drift after that sample
+    """
+    n = values.shape[0]
+    flags = np.zeros(n, dtype=np.bool_)
+
+    totals = np.zeros((MAX_BUCKET_ROWS, max_buckets + 1))
+    variances = np.zeros((MAX_BUCKET_ROWS, max_buckets + 1))
+    sizes = np.zeros(MAX_BUCKET_ROWS, dtype=np.int64)
+    n_rows = 1
+    total = 0.0
+    variance = 0.0
+    width = 0.0
+    tick = 0
+    drift = False
+
+    for i in range(n):
+        # river starts a fresh window on the update after a detection
+        if drift:
+            totals[:, :] = 0.0
+            variances[:, :] = 0.0
+            sizes[:] = 0
+            n_rows = 1
+            total = 0.0
+            variance = 0.0
+            width = 0.0
+            tick = 0
+
+        # Insert the new value as a bucket of size 1
+        value = values[i]
+        totals[0, sizes[0]] = value
+        variances[0, sizes[0]] = 0.0
+        sizes[0] += 1
+        width += 1.0
+        if width > 1.0:
+            diff = value - total / (width - 1.0)
+            variance += (width - 1.0) * diff * diff / width
+        total += value
+
+        # Merge the two oldest buckets of any row that overflows
+        row = 0
+        while row < n_rows and sizes[row] == max_buckets + 1:
+            if row + 1 == n_rows:
+                n_rows += 1
+            size = 2.0 ** row
+            mu1 = totals[row, 0] / size
+            mu2 = totals[row, 1] / size
+            nxt = row + 1
+            totals[nxt, sizes[nxt]] = totals[row, 0] + totals[row, 1]
+            variances[nxt, sizes[nxt]] = (variances[row, 0] + variances[row, 1]
+                                          + size * size * (mu1 - mu2) * (mu1 - mu2)
+                                          / (size + size))
+            sizes[nxt] += 1
+            _drop_buckets(totals, variances, sizes, row, 2)
+            if sizes[nxt] <= max_buckets:
+                break
+            row += 1
+
+        # Check every cut of the window, dropping old buckets while one holds
+        drift = False
+        tick += 1
+        if tick % clock == 0 and width > grace_period:
+            reduce_width = True
+            while reduce_width:
+                reduce_width = False
+                done = False
+                n0 = 0.0
+                n1 = width
+                u0 = 0.0
+                u1 = total
+                for row in range(n_rows - 1, -1, -1):
+                    if done:
+                        break
+                    size = 2.0 ** row
+                    for k in range(sizes[row] - 1):
+                        n0 += size
+                        n1 -= size
+                        u0 += totals[row, k]
+                        u1 -= totals[row, k]
+                        if n1 < min_window_length or n0 < min_window_length:
+                            continue
+
+                        delta_prime = math.log(2.0 * math.log(width) / delta)
+                        m_recip = (1.0 / (n0 - min_window_length + 1)
+                                   + 1.0 / (n1 - min_window_length + 1))
+                        epsilon = (math.sqrt(2.0 * m_recip * (variance / width) * delta_prime)
+                                   + 2.0 / 3.0 * delta_prime * m_recip)
+                        if abs(u0 / n0 - u1 / n1) > epsilon:
+                            reduce_width = True
+                            drift = True
+                            if width > 0:
+                                # Drop the oldest bucket from the window
+                                last = n_rows - 1
+                                dropped = 2.0 ** last
+                                dropped_total = totals[last, 0]
+                                dropped_mean = dropped_total / dropped
+                                width -= dropped
+                                total -= dropped_total
+                                window_mean = total / width
+                                variance -= (variances[last, 0] + dropped * width
+                                             * (dropped_mean - window_mean)
+                                             * (dropped_mean - window_mean)
+                                             / (dropped + width))
+                                _drop_buckets(totals, variances, sizes, last, 1)
+                                if sizes[last] == 0:
+                                    n_rows -= 1
+                                done = True
+                                break
+
+        flags[i] = drift
+
+    return flags
+
+
+def _scan_chunk(values: np.ndarray, skip: int, delta: float, params: Dict) -> np.ndarray:
+    """
+    Run a fresh ADWIN over values and return drift flags from index skip on.
+
+    The first skip samples only warm the detector up with data preceding the
+    chunk (worker for DriftDetector.process_all_windows_parallel).
+    """
+    if NUMBA_AVAILABLE:
+        return adwin_scan(values, delta, **params)[skip:]
+
+    adwin = ADWIN(delta=delta, **params)
+    flags = np.zeros(len(values), dtype=np.bool_)
+    for i, value in enumerate(values.tolist()):
+        adwin.update(value)
+        if adwin.drift_detected:
+            flags[i] = True
+    return flags[skip:]
+
 
 class WindowedPredictions:
     """Container for a window of predictions."""
 
-    def __init__(self, window_id: int, predictions: List[Dict], metadata: Optional[Dict] = None):
+    def __init__(self, window_id: int, predictions: List[Dict], metadata: Optional[Dict] = None,
+                 values: Optional[np.ndarray] = None, moments: Optional[Tuple[float, float]] = None):
         self.window_id = window_id
         self.predictions = predictions
         self.metadata = metadata or {}
+        # Optional precomputed float64 prediction values (e.g. a view into a
+        # shared array built by DriftDetector.create_windows) and (mean, std)
+        self._values: Optional[np.ndarray] = values
+        self._moments: Optional[Tuple[float, float]] = moments
 
     @property
     def prediction_values(self) -> np.ndarray:
-        """Extract prediction values as numpy array."""
-        return np.array([p["prediction"] for p in self.predictions])
+        """Extract prediction values as numpy array (built once, then cached)."""
+        if self._values is None:
+            self._values = np.fromiter((p["prediction"] for p in self.predictions),
+                                       dtype=np.float64, count=len(self.predictions))
+        return self._values
+
+    def _stats(self) -> Tuple[float, float]:
+        """Mean and standard deviation of predictions in window (computed once)."""
+        if self._moments is None:
+            values = self.prediction_values
+            # Sum and sum of squares (a dot product) instead of mean() then std()
+            n = values.size
+            mean = values.sum() / n
+            var = (values @ values) / n - mean * mean
+            self._moments = (float(mean), float(np.sqrt(max(var, 0.0))))
+        return self._moments
 
     @property
     def mean(self) -> float:
         """Calculate mean of predictions in window."""
-        return float(self.prediction_values.mean())
+        return self._stats()[0]
 
     @property
     def std(self) -> float:
         """Calculate standard deviation of predictions in window."""
-        return float(self.prediction_values.std())
+        return self._stats()[1]
 
     @property
     def count(self) -> int:
@@ -53,17 +270,34 @@ class DriftDetector:
     Processes predictions in windows and detects drift using River's ADWIN.
     """
 
-    def __init__(self, window_size: int = 100, delta: float = 0.002):
+    def __init__(self, window_size: int = 100, delta: float = 0.002, use_jit: bool = False,
+                 clock: int = 32, max_buckets: int = 5, min_window_length: int = 5,
+                 grace_period: int = 10):
         """
         Initialize drift detector.
 
         Args:
             window_size: Number of predictions per window
             delta: ADWIN sensitivity parameter (smaller = more sensitive)
+            use_jit: If True and numba is installed, process_all_windows runs
+                ADWIN over the whole stream with the compiled adwin_scan
+                instead of river (same detections)
+            clock: ADWIN checks for change every `clock` samples (higher =
+                less CPU, slightly later detection)
+            max_buckets: ADWIN buckets kept per histogram row before merging
+            min_window_length: Minimum ADWIN sub-window length when cutting
+            grace_period: Samples ADWIN sees before it can detect drift
         """
         self.window_size = window_size
         self.delta = delta
-        self.adwin = ADWIN(delta=delta)
+        self.adwin_params = {
+            "clock": clock,
+            "max_buckets": max_buckets,
+            "min_window_length": min_window_length,
+            "grace_period": grace_period,
+        }
+        self.adwin = ADWIN(delta=delta, **self.adwin_params)
+        self.use_jit = use_jit and NUMBA_AVAILABLE
 
         # Statistics tracking
         self.baseline_mean = None
@@ -80,13 +314,13 @@ class DriftDetector:
         Returns:
             List of prediction dictionaries
         """
-        predictions = []
-        with open(log_file, "r") as f:
-            for line in f:
-                line = line.strip()
-                if line:
-                    predictions.append(json.loads(line))
-        return predictions
+        with open(log_file, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return []
+            # Read lines straight from the memory-mapped file (no text layer
+            # or read buffer copies)
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return [json_loads(line) for line in iter(mm.readline, b"") if not line.isspace()]
 
     def load_window_metadata(self, metadata_file: str) -> List[Dict]:
         """
@@ -113,57 +347,92 @@ class DriftDetector:
             List of WindowedPredictions objects
         """
         windows = []
-        window_id = 0
-
-        for i in range(0, len(predictions), self.window_size):
-            window_predictions = predictions[i:i + self.window_size]
-
+        size = self.window_size
+
+        # Extract all prediction values once; each window gets a zero-copy view
+        values = np.fromiter((p["prediction"] for p in predictions),
+                             dtype=np.float64, count=len(predictions))
+
+        # Non-overlapping views of the full windows, with their stats in one pass
+        full = len(values) // size
+        if full:
+            win_view = sliding_window_view(values, size)[::size]
+            mean = win_view.sum(axis=1) / size
+            var = np.einsum("ij,ij->i", win_view, win_view) / size - mean * mean
+            means = mean.tolist()
+            stds = np.sqrt(np.maximum(var, 0.0)).tolist()
+
+        for window_id, i in enumerate(range(0, len(predictions), size)):
             # Match with metadata if available
             window_meta = None
             if metadata and window_id < len(metadata):
                 window_meta = metadata[window_id]
 
-            window = WindowedPredictions(window_id, window_predictions, window_meta)
+            if window_id < full:
+                window = WindowedPredictions(window_id, predictions[i:i + size], window_meta,
+                                             win_view[window_id],
+                                             (means[window_id], stds[window_id]))
+            else:
+                # Final incomplete window
+                window = WindowedPredictions(window_id, predictions[i:], window_meta,
+                                             values[i:])
             windows.append(window)
-            window_id += 1
 
         return windows
 
-    def detect_drift_in_window(self, window: WindowedPredictions) -> Dict:
+    def detect_drift_in_window(self, window: WindowedPredictions,
+                               adwin_detected: Optional[bool] = None) -> Dict:
         """
         Detect drift in a single window using ADWIN.
 
+        The detector only tests for a change every `clock` samples, so a
+        shift is reported up to `clock` samples after it enters the stream.
+
         Args:
             window: WindowedPredictions object
+            adwin_detected: Precomputed ADWIN outcome for this window (e.g. from
+                adwin_scan); if None, the window is fed to the river detector
 
         Returns:
             Detection result dictionary
         """
         drift_detected_in_window = False
 
-        # Feed each prediction to ADWIN
-        for pred_value in window.prediction_values:
-            self.adwin.update(pred_value)
-            if self.adwin.drift_detected:
-                drift_detected_in_window = True
+        if adwin_detected is not None:
+            drift_detected_in_window = adwin_detected
+        else:
+            # Feed each prediction to ADWIN (plain floats iterate faster than ndarray)
+            adwin = self.adwin
+            update = adwin.update
+            pred_values = iter(window.prediction_values.tolist())
+            for pred_value in pred_values:
+                update(pred_value)
+                if adwin.drift_detected:
+                    drift_detected_in_window = True
+                    break
+            # Once drift is flagged, the rest of the window only updates ADWIN
+            for pred_value in pred_values:
+                update(pred_value)
+
+        current_mean, current_std = window._stats()
 
         # Set baseline from first window
         if self.baseline_mean is None:
-            self.baseline_mean = window.mean
+            self.baseline_mean = current_mean
 
         # Calculate drift statistic (absolute difference from baseline)
-        drift_statistic = abs(window.mean - self.baseline_mean)
+        drift_statistic = abs(current_mean - self.baseline_mean)
 
         # Create detection result
         result = {
             "window_id": window.window_id,
             "timestamp": window.timestamp,
-            "drift_statistic": round(drift_statistic, 6),
+            "drift_statistic": drift_statistic,
             "drift_detected": drift_detected_in_window,
             "adwin_detected": drift_detected_in_window,
-            "baseline_mean": round(self.baseline_mean, 6),
-            "current_mean": round(window.mean, 6),
-            "current_std": round(window.std, 6),
+            "baseline_mean": self.baseline_mean,
+            "current_mean": current_mean,
+            "current_std": current_std,
             "predictions_processed": window.count
         }
 
@@ -173,20 +442,84 @@ class DriftDetector:
 
         return result
 
-    def process_all_windows(self, predictions: List[Dict], metadata: Optional[List[Dict]] = None):
+    def process_all_windows(self, predictions: List[Dict], metadata: Optional[List[Dict]] = None,
+                            verbose: bool = True):
         """
         Process all predictions and detect drift.
 
         Args:
             predictions: List of prediction dictionaries
             metadata: Optional window metadata
+            verbose: If True, print a status line for every window
+        """
+        self._start_processing(predictions, metadata,
+                               "compiled scan" if self.use_jit else None)
+
+        window_flags = [None] * len(self.windows)
+        if self.use_jit and self.windows:
+            # One compiled pass over the whole stream, then split per window
+            window_flags = self._flags_per_window(adwin_scan(
+                np.concatenate([w.prediction_values for w in self.windows]),
+                self.delta, **self.adwin_params))
+
+        self._detect_windows(window_flags, verbose)
+
+    def process_all_windows_parallel(self, predictions: List[Dict], metadata: Optional[List[Dict]] = None,
+                                     workers: Optional[int] = None,
+                                     overlap: int = RECONCILE_SAMPLES, verbose: bool = True):
         """
+        Process all predictions, scanning chunks of the stream in parallel.
+
+        The stream is split into one chunk per worker on window boundaries,
+        and each chunk is scanned by a fresh ADWIN in its own process. Before
+        its own samples, each chunk replays the `overlap` samples that precede
+        it, so a change that straddles a boundary is still caught. ADWIN state
+        older than that is not carried over, so detections can differ slightly
+        from process_all_windows; use it for large offline logs.
+
+        Args:
+            predictions: List of prediction dictionaries
+            metadata: Optional window metadata
+            workers: Number of worker processes (defaults to the CPU count)
+            overlap: Samples before each chunk used to warm up its detector
+            verbose: If True, print a status line for every window
+        """
+        workers = workers or os.cpu_count() or 1
+        self._start_processing(predictions, metadata, f"{workers} parallel chunks")
+        if not self.windows:
+            self._detect_windows([], verbose)
+            return
+
+        values = np.concatenate([w.prediction_values for w in self.windows])
+        windows_per_chunk = -(-len(self.windows) // workers)
+        chunk_size = windows_per_chunk * self.window_size
+        chunks, skips = [], []
+        for start in range(0, len(values), chunk_size):
+            warmup = max(0, start - overlap)
+            chunks.append(values[warmup:start + chunk_size])
+            skips.append(start - warmup)
+
+        n = len(chunks)
+        args = (chunks, skips, [self.delta] * n, [self.adwin_params] * n)
+        if n > 1:
+            with ProcessPoolExecutor(max_workers=n) as pool:
+                flags = list(pool.map(_scan_chunk, *args))
+        else:
+            flags = list(map(_scan_chunk, *args))
+
+        self._detect_windows(self._flags_per_window(np.concatenate(flags)), verbose)
+
+    def _start_processing(self, predictions: List[Dict], metadata: Optional[List[Dict]],
+                          backend: Optional[str] = None):
+        """Print the run configuration and create windows."""
         print("=" * 70)
         print("Drift Detection Engine - Epic 3")
         print("=" * 70)
         print(f"Configuration:")
         print(f"  Window size: {self.window_size}")
         print(f"  ADWIN delta: {self.delta}")
+        if backend:
+            print(f"  ADWIN backend: {backend}")
         print(f"  Total predictions: {len(predictions)}")
         print()
 
@@ -195,25 +528,48 @@ class DriftDetector:
         print(f"Created {len(self.windows)} windows")
         print()
 
-        # Process each window
-        print("Processing windows...")
+    def _flags_per_window(self, flags: np.ndarray) -> List[bool]:
+        """Reduce per-sample ADWIN flags to one flag per window."""
+        window_flags = []
+        offset = 0
         for window in self.windows:
-            result = self.detect_drift_in_window(window)
-            self.detection_results.append(result)
-
-            # Print result
-            status = "DRIFT" if result["drift_detected"] else "STABLE"
-            gt_status = ""
-            if "ground_truth_drift" in result:
-                gt = "DRIFT" if result["ground_truth_drift"] else "STABLE"
-                match = "✓" if (result["drift_detected"] == result["ground_truth_drift"]) else "✗"
-                gt_status = f" | Ground truth: {gt} {match}"
+            end = offset + len(window.prediction_values)
+            window_flags.append(bool(flags[offset:end].any()))
+            offset = end
+        return window_flags
 
-            print(f"  Window {result['window_id']:2d}: {status:6s} | "
-                  f"stat={result['drift_statistic']:.4f} | "
-                  f"mean={result['current_mean']:.4f}{gt_status}")
-
-        print()
+    def _detect_windows(self, window_flags: List[Optional[bool]], verbose: bool):
+        """Build detection results for every window and print their status."""
+        # Process each window
+        print("Processing windows...")
+        # Pause cyclic GC while the loop churns through short-lived objects
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        lines = []
+        try:
+            for window, adwin_detected in zip(self.windows, window_flags):
+                result = self.detect_drift_in_window(window, adwin_detected)
+                self.detection_results.append(result)
+                if not verbose:
+                    continue
+
+                # Format result
+                status = "DRIFT" if result["drift_detected"] else "STABLE"
+                gt_status = ""
+                if "ground_truth_drift" in result:
+                    gt = "DRIFT" if result["ground_truth_drift"] else "STABLE"
+                    match = "✓" if (result["drift_detected"] == result["ground_truth_drift"]) else "✗"
+                    gt_status = f" | Ground truth: {gt} {match}"
+
+                lines.append(f"  Window {result['window_id']:2d}: {status:6s} | "
+                             f"stat={result['drift_statistic']:.4f} | "
+                             f"mean={result['current_mean']:.4f}{gt_status}")
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+
+        lines.append("")
+        print("\n".join(lines))
 
     def save_results(self, output_path: str = "outputs/detection/drift_detection.json"):
         """
@@ -224,12 +580,43 @@ class DriftDetector:
         """
         Path(output_path).parent.mkdir(parents=True, exist_ok=True)
 
-        with open(output_path, "w") as f:
-            json.dump(self.detection_results, f, indent=2)
+        rounded = list(self._rounded_results())
+        if orjson is not None:
+            with open(output_path, "wb") as f:
+                f.write(orjson.dumps(rounded, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+        else:
+            with open(output_path, "w") as f:
+                json.dump(rounded, f, indent=2)
+
+        print(f"✓ Drift detection results saved to {output_path}")
+        print(f"  Total windows analyzed: {len(self.detection_results)}")
+
+    def save_results_jsonl(self, output_path: str = "outputs/detection/drift_detection.jsonl"):
+        """
+        Save drift detection results to a JSONL file, one result per line.
+
+        Args:
+            output_path: Path to output JSONL file
+        """
+        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+
+        with open(output_path, "wb") as f:
+            for result in self._rounded_results():
+                if orjson is not None:
+                    f.write(orjson.dumps(result, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_SERIALIZE_NUMPY))
+                else:
+                    f.write(json.dumps(result).encode() + b"\n")
 
         print(f"✓ Drift detection results saved to {output_path}")
         print(f"  Total windows analyzed: {len(self.detection_results)}")
 
+    def _rounded_results(self) -> Iterator[Dict]:
+        """Detection results with float fields rounded for output."""
+        # Round float fields only here, keeping full precision in memory
+        for result in self.detection_results:
+            yield {key: round(value, RESULT_DECIMALS) if key in ROUNDED_FIELDS else value
+                   for key, value in result.items()}
+
     def print_summary(self):
         """Print summary statistics."""
         if not self.detection_results:
@@ -251,17 +638,19 @@ class DriftDetector:
         # If ground truth available, calculate accuracy
         gt_results = [r for r in self.detection_results if "ground_truth_drift" in r]
         if gt_results:
-            correct = sum(1 for r in gt_results if r["drift_detected"] == r["ground_truth_drift"])
+            # True positives, false positives, etc. from two boolean arrays
+            detected = np.fromiter((r["drift_detected"] for r in gt_results), dtype=bool, count=len(gt_results))
+            truth = np.fromiter((r["ground_truth_drift"] for r in gt_results), dtype=bool, count=len(gt_results))
+            tp = int(np.count_nonzero(detected & truth))
+            fp = int(np.count_nonzero(detected & ~truth))
+            fn = int(np.count_nonzero(~detected & truth))
+            tn = len(gt_results) - tp - fp - fn
+
+            correct = tp + tn
             accuracy = 100 * correct / len(gt_results)
             print(f"Ground Truth Comparison:")
             print(f"  Accuracy: {accuracy:.1f}% ({correct}/{len(gt_results)})")
 
-            # True positives, false positives, etc.
-            tp = sum(1 for r in gt_results if r["drift_detected"] and r["ground_truth_drift"])
-            fp = sum(1 for r in gt_results if r["drift_detected"] and not r["ground_truth_drift"])
-            tn = sum(1 for r in gt_results if not r["drift_detected"] and not r["ground_truth_drift"])
-            fn = sum(1 for r in gt_results if not r["drift_detected"] and r["ground_truth_drift"])
-
             print(f"  True Positives:  {tp}")
             print(f"  False Positives: {fp}")
             print(f"  True Negatives:  {tn}")
@@ -330,6 +719,41 @@ Examples:
         default="outputs/detection/drift_detection.json",
         help="Output path for detection results (default: outputs/detection/drift_detection.json)"
     )
+    parser.add_argument(
+        "--clock",
+        type=int,
+        default=32,
+        help="ADWIN checks for change every N samples - higher=faster, later detection (default: 32)"
+    )
+    parser.add_argument(
+        "--max-buckets",
+        type=int,
+        default=5,
+        help="ADWIN buckets per histogram row before merging (default: 5)"
+    )
+    parser.add_argument(
+        "--min-window-length",
+        type=int,
+        default=5,
+        help="Minimum ADWIN sub-window length (default: 5)"
+    )
+    parser.add_argument(
+        "--grace-period",
+        type=int,
+        default=10,
+        help="Samples seen before ADWIN can detect drift (default: 10)"
+    )
+    parser.add_argument(
+        "--jit",
+        action="store_true",
+        help="Run ADWIN with the numba-compiled scan (requires numba; falls back to river)"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Scan the log in this many parallel chunks (approximate; default: sequential)"
+    )
 
     args = parser.parse_args()
 
@@ -369,7 +793,10 @@ Examples:
             log_file = f"logs/{log_file}"
 
     # Initialize detector
-    detector = DriftDetector(window_size=args.window_size, delta=args.delta)
+    detector = DriftDetector(window_size=args.window_size, delta=args.delta, use_jit=args.jit,
+                             clock=args.clock, max_buckets=args.max_buckets,
+                             min_window_length=args.min_window_length,
+                             grace_period=args.grace_period)
 
     # Load data
     try:
@@ -389,7 +816,10 @@ Examples:
         print("Proceeding without ground truth labels\n")
 
     # Process windows and detect drift
-    detector.process_all_windows(predictions, metadata)
+    if args.workers:
+        detector.process_all_windows_parallel(predictions, metadata, workers=args.workers)
+    else:
+        detector.process_all_windows(predictions, metadata)
 
     # Save results
     detector.save_results(args.output)
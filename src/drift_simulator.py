@@ -10,11 +10,14 @@ from pathlib import Path
 from typing import Dict, List, Optional
 import numpy as np
 
+# Number of samples drawn per vectorized refill of a phase's sample buffer
+SAMPLE_CHUNK_SIZE = 1024
+
 
 class DriftPhaseConfig:
     """Configuration for a single drift phase."""
 
-    def __init__(self, config: Dict):
+    def __init__(self, config: Dict, rng: Optional[np.random.Generator] = None):
         self.phase_id = config["phase_id"]
         self.name = config["name"]
         self.num_requests = config["num_requests"]
@@ -22,13 +25,27 @@ class DriftPhaseConfig:
         self.drift_type = config["drift_type"]
         self.distribution = config["distribution"]
 
+        self.feature_names = list(self.distribution.keys())
+        self.means = np.array([p["mean"] for p in self.distribution.values()], dtype=np.float64)
+        self.stds = np.array([p["std"] for p in self.distribution.values()], dtype=np.float64)
+        self.rng = rng if rng is not None else np.random.default_rng()
+
+        # Pregenerated samples, consumed one row at a time by generate_sample
+        self._samples: List[List[float]] = []
+        self._next_sample = 0
+
+    def pregenerate(self, n: int) -> np.ndarray:
+        """Draw n samples at once as an (n, num_features) array."""
+        return self.rng.standard_normal((n, len(self.means))) * self.stds + self.means
+
     def generate_sample(self) -> Dict[str, float]:
         """Generate a single sample from this phase's distribution."""
-        sample = {}
-        for feature_name, params in self.distribution.items():
-            value = np.random.normal(params["mean"], params["std"])
-            sample[feature_name] = float(value)
-        return sample
+        if self._next_sample >= len(self._samples):
+            self._samples = self.pregenerate(SAMPLE_CHUNK_SIZE).tolist()
+            self._next_sample = 0
+        row = self._samples[self._next_sample]
+        self._next_sample += 1
+        return dict(zip(self.feature_names, row))
 
 
 class DriftSimulator:
@@ -44,11 +61,15 @@ class DriftSimulator:
         """
         self.predict_url = predict_url
         self.config = self._load_config(config_path)
-        self.phases = [DriftPhaseConfig(phase) for phase in self.config["drift_phases"]]
+        self.rng = np.random.default_rng()
+        self.phases = [DriftPhaseConfig(phase, self.rng) for phase in self.config["drift_phases"]]
         self.request_rate = self.config["simulation"]["request_rate"]
         self.total_requests = self.config["simulation"]["total_requests"]
         self.window_size = self.config["simulation"]["window_size"]
 
+        # One keep-alive session so consecutive requests reuse the connection
+        self.session = requests.Session()
+
         # Statistics tracking
         self.requests_sent = 0
         self.requests_failed = 0
@@ -108,7 +129,7 @@ class DriftSimulator:
             Response JSON or None if failed
         """
         try:
-            response = requests.post(
+            response = self.session.post(
                 self.predict_url,
                 json={"features": features},
                 timeout=5
@@ -160,6 +181,10 @@ class DriftSimulator:
         print(f"\n✓ Window metadata saved to {output_path}")
         print(f"  Total windows: {len(self.window_metadata)}")
 
+    def close(self):
+        """Close the HTTP session and its pooled connections."""
+        self.session.close()
+
     def run(self):
         """Run the drift simulation."""
         print("=" * 60)
@@ -175,7 +200,7 @@ class DriftSimulator:
 
         # Verify service is running
         try:
-            response = requests.get(self.predict_url.replace("/predict", "/"))
+            response = self.session.get(self.predict_url.replace("/predict", "/"))
             print(f"✓ Model service is running: {response.json()['model_version']}")
         except requests.exceptions.RequestException:
             print("✗ Model service is not running!")
@@ -188,6 +213,7 @@ class DriftSimulator:
         print(f"→ Starting Phase {phase.phase_id}: {phase.name} (drift={phase.is_drift})")
 
         delay = 1.0 / self.request_rate if self.request_rate > 0 else 0
+        next_deadline = time.monotonic()
 
         for i in range(self.total_requests):
             # Generate and send request
@@ -202,9 +228,13 @@ class DriftSimulator:
                 if (i + 1) % 50 == 0:
                     print(f"  Progress: {i + 1}/{self.total_requests} requests sent")
 
-            # Rate limiting
+            # Rate limiting against a fixed schedule, so request latency
+            # doesn't lower the achieved rate
             if delay > 0:
-                time.sleep(delay)
+                next_deadline += delay
+                now = time.monotonic()
+                if now < next_deadline:
+                    time.sleep(next_deadline - now)
 
         # Handle final incomplete window
         if self.current_window_predictions > 0:
@@ -277,7 +307,10 @@ Examples:
     args = parser.parse_args()
 
     simulator = DriftSimulator(args.config, args.url)
-    simulator.run()
+    try:
+        simulator.run()
+    finally:
+        simulator.close()
 
     # Save with custom output path if specified
     if args.output != "outputs/metadata/window_metadata.json":
@@ -2,16 +2,41 @@
 FastAPI Model Service for Drift Detection System.
 Implements Epic 1: Local Model Service with prediction endpoint and logging.
 """
+import asyncio
+import atexit
 import pickle
 import json
 import os
+import queue
+import sys
+import threading
 from datetime import datetime
 from pathlib import Path
-from typing import Dict
+from typing import Callable, Dict, List, Optional, Tuple
 
 import numpy as np
-from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel
+from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi.exceptions import RequestValidationError
+from pydantic import BaseModel, ValidationError
+
+try:
+    from orjson import dumps as json_dumps
+except ImportError:  # orjson is optional; stdlib json writes the same records
+    def json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
+try:
+    import msgspec
+except ImportError:  # msgspec is optional; pydantic parses the same requests
+    msgspec = None
+
+# Maximum number of queued log lines written per batch
+LOG_BATCH_SIZE = 1024
+
+# Maximum number of requests scored per predict_proba call, and how long the
+# first request of a batch waits for others to join it (seconds)
+PREDICT_BATCH_SIZE = 64
+PREDICT_BATCH_WAIT = 0.001
 
 
 # Request and Response Models
@@ -25,19 +50,227 @@ class PredictionResponse(BaseModel):
     timestamp: str
 
 
+if msgspec is not None:
+    class _PredictionRequestStruct(msgspec.Struct):
+        features: Dict[str, float]
+
+    _request_decoder = msgspec.json.Decoder(_PredictionRequestStruct)
+
+
+def decode_prediction_request(body: bytes) -> Dict[str, float]:
+    """
+    Parse a /predict request body and return its features.
+
+    Uses a msgspec decoder when installed and pydantic's JSON parser
+    otherwise; both accept the same PredictionRequest shape.
+
+    Raises:
+        RequestValidationError: If the body is not a valid PredictionRequest
+    """
+    if msgspec is not None:
+        try:
+            return _request_decoder.decode(body).features
+        except msgspec.DecodeError as e:
+            raise RequestValidationError([{"loc": ("body",), "msg": str(e), "type": "value_error"}])
+    try:
+        return PredictionRequest.model_validate_json(body).features
+    except ValidationError as e:
+        raise RequestValidationError([{**error, "loc": ("body", *error["loc"])}
+                                      for error in e.errors()])
+
+
 # Initialize FastAPI app
 app = FastAPI(title="Drift Detection Model Service")
 
 # Global variables for model and metadata
 model = None
 metadata = None
+feature_names: Tuple[str, ...] = ()
 logs_dir = Path("logs")
 
 
+class PredictionLogWriter:
+    """
+    Appends prediction log lines from a background thread.
+
+    Lines are queued by request handlers and written in batches through a
+    kept-open file handle, so requests never wait on disk I/O.
+    """
+
+    def __init__(self, batch_size: int = LOG_BATCH_SIZE):
+        self.batch_size = batch_size
+        self._queue: "queue.Queue" = queue.Queue()
+        self._files: Dict[Path, object] = {}
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def submit(self, log_file: Path, line: bytes) -> None:
+        """Queue one encoded line for appending to a log file."""
+        if self._thread is None:
+            self._start()
+        self._queue.put((log_file, line))
+
+    def flush(self) -> None:
+        """Block until every queued line has been written."""
+        if self._thread is not None:
+            self._queue.join()
+
+    def close(self) -> None:
+        """Write any queued lines, stop the writer thread and close files."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._queue.put(None)
+            thread.join()
+            atexit.unregister(self.close)
+
+    def _start(self) -> None:
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True,
+                                                name="prediction-log-writer")
+                self._thread.start()
+                atexit.register(self.close)
+
+    def _run(self) -> None:
+        get = self._queue.get
+        get_nowait = self._queue.get_nowait
+        while True:
+            batch = [get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(get_nowait())
+                except queue.Empty:
+                    break
+
+            stop = None in batch
+            self._write([item for item in batch if item is not None])
+            for _ in batch:
+                self._queue.task_done()
+            if stop:
+                for f in self._files.values():
+                    f.close()
+                self._files.clear()
+                return
+
+    def _write(self, batch: List[Tuple[Path, bytes]]) -> None:
+        # Group lines per file, keeping their order within each file
+        grouped: Dict[Path, List[bytes]] = {}
+        for log_file, line in batch:
+            grouped.setdefault(log_file, []).append(line)
+
+        for log_file, lines in grouped.items():
+            try:
+                f = self._files.get(log_file)
+                if f is None:
+                    # A new file (e.g. the date rolled over) replaces the old handles
+                    for old in self._files.values():
+                        old.close()
+                    self._files.clear()
+                    f = self._files[log_file] = open(log_file, "ab")
+                f.write(b"".join(lines))
+                f.flush()
+            except OSError as e:
+                self._files.pop(log_file, None)
+                print(f"✗ Failed to write prediction log {log_file}: {e}", file=sys.stderr)
+
+
+# Background writer shared by all requests
+_prediction_log = PredictionLogWriter()
+
+
+class PredictionBatcher:
+    """
+    Coalesces concurrent prediction requests into batched model calls.
+
+    Feature rows are queued with a future; a task on the event loop collects
+    up to max_batch rows (waiting at most max_wait after the first one) and
+    scores them with a single predict call, since per-call overhead dominates
+    the cost of scoring a single row.
+    """
+
+    def __init__(self, predict_fn: Callable[[np.ndarray], np.ndarray],
+                 max_batch: int = PREDICT_BATCH_SIZE, max_wait: float = PREDICT_BATCH_WAIT):
+        self.predict_fn = predict_fn
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def predict(self, row: List[float]) -> float:
+        """Queue one feature row and wait for its prediction."""
+        loop = asyncio.get_running_loop()
+        if self._task is None or self._task.get_loop() is not loop:
+            self._start()
+        future = loop.create_future()
+        self._queue.put_nowait((row, future))
+        return await future
+
+    async def close(self) -> None:
+        """Stop the batching task; queued requests fail with CancelledError."""
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+            while not self._queue.empty():
+                _, future = self._queue.get_nowait()
+                future.cancel()
+
+    def _start(self) -> None:
+        self._queue = asyncio.Queue()
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        get = self._queue.get
+        get_nowait = self._queue.get_nowait
+        while True:
+            batch = [await get()]
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.max_batch:
+                try:
+                    batch.append(get_nowait())
+                    continue
+                except asyncio.QueueEmpty:
+                    pass
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            try:
+                # One (B, F) array and one model call for the whole batch
+                predictions = self.predict_fn(np.array([row for row, _ in batch],
+                                                       dtype=np.float64)).tolist()
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            for (_, future), prediction in zip(batch, predictions):
+                if not future.done():
+                    future.set_result(prediction)
+
+
+def _predict_positive(features: np.ndarray) -> np.ndarray:
+    """Probability of the positive class for each row of features."""
+    return model.predict_proba(features)[:, 1]
+
+
+# Batcher shared by all /predict requests
+_predict_batcher = PredictionBatcher(_predict_positive)
+
+
 @app.on_event("startup")
 async def load_model():
     """Load the pre-trained model and metadata at startup."""
-    global model, metadata
+    global model, metadata, feature_names
 
     model_path = "models/model_v1.0.pkl"
     metadata_path = "models/model_metadata.pkl"
@@ -51,6 +284,7 @@ async def load_model():
         # Load metadata
         with open(metadata_path, "rb") as f:
             metadata = pickle.load(f)
+        feature_names = tuple(metadata["feature_names"])
         print(f"✓ Metadata loaded successfully from {metadata_path}")
         print(f"  Model version: {metadata['version']}")
         print(f"  Model type: {metadata['model_type']}")
@@ -66,6 +300,13 @@ async def load_model():
         raise
 
 
+@app.on_event("shutdown")
+async def close_prediction_log():
+    """Stop request batching and write out queued prediction log entries."""
+    await _predict_batcher.close()
+    _prediction_log.close()
+
+
 @app.get("/")
 async def root():
     """Health check endpoint."""
@@ -76,13 +317,22 @@ async def root():
     }
 
 
-@app.post("/predict", response_model=PredictionResponse)
-async def predict(request: PredictionRequest):
+@app.post("/predict", response_model=PredictionResponse, openapi_extra={
+    "requestBody": {
+        "required": True,
+        "content": {"application/json": {"schema": PredictionRequest.model_json_schema()}},
+    }
+})
+async def predict(request: Request):
     """
     Make predictions on input features.
 
+    The body is parsed directly (see decode_prediction_request) and the
+    response encoded with json_dumps, bypassing FastAPI's per-request model
+    validation.
+
     Args:
-        request: PredictionRequest containing features dict
+        request: Request whose JSON body is a PredictionRequest
 
     Returns:
         PredictionResponse with prediction, model version, and timestamp
@@ -90,15 +340,19 @@ async def predict(request: PredictionRequest):
     if model is None or metadata is None:
         raise HTTPException(status_code=503, detail="Model not loaded")
 
+    features = decode_prediction_request(await request.body())
+
     try:
-        # Extract features in correct order
-        feature_names = metadata["feature_names"]
-        features_array = np.array([[
-            request.features.get(name, 0.0) for name in feature_names
-        ]])
+        # Extract features in correct order; clients normally send them in
+        # model order already, so the values can be taken as they are
+        if tuple(features) == feature_names:
+            features_row = list(features.values())
+        else:
+            features_row = [features.get(name, 0.0) for name in feature_names]
 
-        # Make prediction (probability of positive class)
-        prediction = float(model.predict_proba(features_array)[0][1])
+        # Make prediction (probability of positive class), batched with
+        # concurrent requests
+        prediction = await _predict_batcher.predict(features_row)
 
         # Create timestamp
         timestamp = datetime.utcnow().isoformat() + "Z"
@@ -106,17 +360,18 @@ async def predict(request: PredictionRequest):
         # Log the prediction (Epic 1, Task 1.2)
         log_prediction(
             timestamp=timestamp,
-            input_features=request.features,
+            input_features=features,
             prediction=prediction,
-            model_version=metadata["version"]
+            model_version=metadata["version"],
+            wait=False
         )
 
         # Return response
-        return PredictionResponse(
-            prediction=prediction,
-            model_version=metadata["version"],
-            timestamp=timestamp
-        )
+        return Response(content=json_dumps({
+            "prediction": prediction,
+            "model_version": metadata["version"],
+            "timestamp": timestamp
+        }), media_type="application/json")
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Prediction error: {str(e)}")
@@ -127,17 +382,22 @@ def log_prediction(
     input_features: Dict[str, float],
     prediction: float,
     model_version: str,
-    drift_phase: int = 1
+    drift_phase: int = 1,
+    wait: bool = True
 ):
     """
     Log prediction to JSON file.
 
+    The entry is written by a background thread.
+
     Args:
         timestamp: ISO format timestamp
         input_features: Dictionary of input features
         prediction: Model prediction value
         model_version: Version of the model used
         drift_phase: Current drift phase (default: 1)
+        wait: If True, return only once the entry is on disk; the prediction
+            endpoint passes False so requests don't block on file I/O
     """
     log_entry = {
         "timestamp": timestamp,
@@ -152,8 +412,9 @@ def log_prediction(
     log_file = logs_dir / f"predictions_{date_str}.jsonl"
 
     # Append to JSONL file (one JSON object per line)
-    with open(log_file, "a") as f:
-        f.write(json.dumps(log_entry) + "\n")
+    _prediction_log.submit(log_file, json_dumps(log_entry) + b"\n")
+    if wait:
+        _prediction_log.flush()
 
 
 if __name__ == "__main__":
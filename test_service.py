@@ -3,15 +3,22 @@ Test script for Epic 1: Local Model Service
 Tests the /predict endpoint and verifies logging functionality.
 """
 import requests
+from requests.adapters import HTTPAdapter
 import json
-import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from tests.log_helpers import count_and_last_line
+
+# Keep-alive session shared by all requests to the service
+_SESSION = requests.Session()
+_SESSION.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=4))
+
 
 def test_health_check():
     """Test the health check endpoint."""
     print("Testing health check endpoint...")
-    response = requests.get("http://localhost:8000/")
+    response = _SESSION.get("http://localhost:8000/")
     print(f"Status: {response.status_code}")
     print(f"Response: {response.json()}\n")
     return response.status_code == 200
@@ -30,7 +37,7 @@ def test_predict_endpoint():
         }
     }
 
-    response = requests.post(
+    response = _SESSION.post(
         "http://localhost:8000/predict",
         json=test_request
     )
@@ -57,11 +64,14 @@ def test_multiple_predictions():
         {"feature1": 3.0, "feature2": 1.0, "feature3": 0.5},
     ]
 
-    for i, features in enumerate(test_cases, 1):
-        response = requests.post(
-            "http://localhost:8000/predict",
-            json={"features": features}
-        )
+    # Send all requests concurrently over the shared session's connection pool
+    with ThreadPoolExecutor(max_workers=len(test_cases)) as executor:
+        responses = list(executor.map(
+            lambda features: _SESSION.post("http://localhost:8000/predict", json={"features": features}),
+            test_cases
+        ))
+
+    for i, response in enumerate(responses, 1):
         if response.status_code == 200:
             result = response.json()
             print(f"  Test {i}: prediction={result['prediction']:.4f}")
@@ -69,8 +79,6 @@ def test_multiple_predictions():
             print(f"  Test {i}: FAILED")
             return False
 
-        time.sleep(0.1)  # Small delay between requests
-
     print()
     return True
 
@@ -93,14 +101,13 @@ def verify_logs():
     latest_log = sorted(log_files)[-1]
     print(f"  ✓ Found log file: {latest_log}")
 
-    with open(latest_log, "r") as f:
-        lines = f.readlines()
+    count, last_line = count_and_last_line(latest_log)
 
-    print(f"  ✓ Number of logged predictions: {len(lines)}")
+    print(f"  ✓ Number of logged predictions: {count}")
 
     # Show a sample log entry
-    if lines:
-        sample = json.loads(lines[-1])
+    if last_line:
+        sample = json.loads(last_line)
         print(f"  ✓ Sample log entry:")
         print(json.dumps(sample, indent=4))
 
@@ -123,13 +130,16 @@ def run_all_tests():
     ]
 
     results = []
-    for test_name, test_func in tests:
-        try:
-            result = test_func()
-            results.append((test_name, result))
-        except Exception as e:
-            print(f"✗ {test_name} failed with error: {e}\n")
-            results.append((test_name, False))
+    try:
+        for test_name, test_func in tests:
+            try:
+                result = test_func()
+                results.append((test_name, result))
+            except Exception as e:
+                print(f"✗ {test_name} failed with error: {e}\n")
+                results.append((test_name, False))
+    finally:
+        _SESSION.close()
 
     # Summary
     print("=" * 60)
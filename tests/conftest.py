@@ -6,25 +6,32 @@ This file contains fixtures that are automatically available to all test modules
 
 import pytest
 import json
-import tempfile
+import numpy as np
 from pathlib import Path
 from datetime import datetime
-import shutil
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; stdlib json writes the same fixtures
+    orjson = None
+
+
+def _dumps(obj, indent=False) -> bytes:
+    """Serialize a fixture object to JSON bytes, with orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None)
+    return json.dumps(obj, indent=2 if indent else None).encode()
 
 
 @pytest.fixture
-def temp_dir():
-    """Create a temporary directory for test files."""
-    temp_path = Path(tempfile.mkdtemp())
-    yield temp_path
-    # Cleanup
-    if temp_path.exists():
-        shutil.rmtree(temp_path)
+def temp_dir(tmp_path):
+    """Temporary directory for test files (pytest's tmp_path, cleaned up by its retention policy)."""
+    return tmp_path
 
 
 @pytest.fixture
 def sample_prediction():
-    """Sample prediction entry matching schema."""
+    """Sample prediction entry matching schema (per test; tests edit its nested features)."""
     return {
         "timestamp": "2025-12-13T10:00:00Z",
         "input_features": {
@@ -38,28 +45,37 @@ def sample_prediction():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_predictions_list():
-    """List of sample predictions for testing."""
-    predictions = []
-    for i in range(100):
-        predictions.append({
-            "timestamp": f"2025-12-13T10:{i:02d}:00Z",
+    """Sample predictions for testing (built once per session; read-only)."""
+    i = np.arange(100)
+    rows = zip(
+        [f"2025-12-13T10:{n:02d}:00Z" for n in range(100)],
+        (5.0 + i * 0.01).tolist(),
+        (2.0 + i * 0.005).tolist(),
+        (1.3 + i * 0.003).tolist(),
+        (0.08 + i * 0.001).tolist(),
+        np.where(i < 50, 1, 2).tolist()
+    )
+    return [
+        {
+            "timestamp": timestamp,
             "input_features": {
-                "feature1": 5.0 + (i * 0.01),
-                "feature2": 2.0 + (i * 0.005),
-                "feature3": 1.3 + (i * 0.003)
+                "feature1": f1,
+                "feature2": f2,
+                "feature3": f3
             },
-            "prediction": 0.08 + (i * 0.001),
+            "prediction": prediction,
             "model_version": "v1.0",
-            "drift_phase": 1 if i < 50 else 2
-        })
-    return predictions
+            "drift_phase": phase
+        }
+        for timestamp, f1, f2, f3, prediction, phase in rows
+    ]
 
 
 @pytest.fixture
 def sample_window_metadata():
-    """Sample window metadata entry."""
+    """Sample window metadata entry (per test; tests edit shallow copies)."""
     return {
         "window_id": 0,
         "start_timestamp": "2025-12-13T10:00:00Z",
@@ -72,7 +88,7 @@ def sample_window_metadata():
 
 @pytest.fixture
 def sample_drift_detection():
-    """Sample drift detection result."""
+    """Sample drift detection result (per test; tests edit shallow copies)."""
     return {
         "window_id": 0,
         "timestamp": "2025-12-13T10:05:00Z",
@@ -89,7 +105,7 @@ def sample_drift_detection():
 
 @pytest.fixture
 def sample_config():
-    """Sample configuration for drift simulation."""
+    """Sample configuration for drift simulation (per test; tests edit its nested sections)."""
     return {
         "simulation": {
             "request_rate": 10,
@@ -125,13 +141,11 @@ def sample_config():
     }
 
 
-@pytest.fixture
-def sample_prediction_log_file(temp_dir, sample_predictions_list):
-    """Create a sample JSONL prediction log file."""
-    log_file = temp_dir / "predictions_test.jsonl"
-    with open(log_file, 'w') as f:
-        for pred in sample_predictions_list:
-            f.write(json.dumps(pred) + '\n')
+@pytest.fixture(scope="session")
+def sample_prediction_log_file(tmp_path_factory, sample_predictions_list):
+    """Create a sample JSONL prediction log file (written once per session)."""
+    log_file = tmp_path_factory.mktemp("logs") / "predictions_test.jsonl"
+    log_file.write_bytes(b'\n'.join(_dumps(pred) for pred in sample_predictions_list) + b'\n')
     return log_file
 
 
@@ -139,8 +153,7 @@ def sample_prediction_log_file(temp_dir, sample_predictions_list):
 def sample_config_file(temp_dir, sample_config):
     """Create a sample config JSON file."""
     config_file = temp_dir / "config_test.json"
-    with open(config_file, 'w') as f:
-        json.dump(sample_config, f, indent=2)
+    config_file.write_bytes(_dumps(sample_config, indent=True))
     return config_file
 
 
@@ -160,9 +173,9 @@ def invalid_prediction():
 
 
 @pytest.fixture
-def malformed_json_file(temp_dir):
+def malformed_json_file(tmp_path):
     """Create a file with malformed JSON."""
-    bad_file = temp_dir / "malformed.jsonl"
+    bad_file = tmp_path / "malformed.jsonl"
     with open(bad_file, 'w') as f:
         f.write('{"valid": "json"}\n')
         f.write('{invalid json without closing brace\n')
@@ -0,0 +1,25 @@
+"""
+Log file helpers shared by the model service test scripts.
+"""
+import os
+
+
+def count_and_last_line(path):
+    """Count the lines of a log file and return its last line, without reading it all into memory."""
+    with open(path, "rb") as f:
+        count = 0
+        chunk = b""
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            count += chunk.count(b"\n")
+        if chunk and not chunk.endswith(b"\n"):
+            count += 1  # Unterminated last line
+
+        # Read backwards from the end until the last complete line is in view
+        pos = f.seek(0, os.SEEK_END)
+        tail = b""
+        while pos > 0 and tail.rstrip(b"\n").count(b"\n") == 0:
+            step = min(4096, pos)
+            pos -= step
+            f.seek(pos)
+            tail = f.read(step) + tail
+    return count, tail.rstrip(b"\n").rsplit(b"\n", 1)[-1]
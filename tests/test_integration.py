@@ -7,6 +7,8 @@ Validates data flow across all components with schema validation.
 
 import unittest
 import json
+import numpy as np
+import pytest
 import subprocess
 import time
 import requests
@@ -21,7 +23,93 @@ sys.path.insert(0, str(project_root / 'src'))
 sys.path.insert(0, str(project_root / 'schemas'))
 
 from src.data_manager import DataManager
-from schema_registry import get_registry
+from schema_registry import get_registry, iter_jsonl_lines
+
+try:
+    from msgspec.json import decode as json_decode
+except ImportError:  # msgspec is optional; stdlib json reads the same files
+    from json import loads as json_decode
+
+# Shared schema registry; each schema's validator is built once, on first use
+_REGISTRY = get_registry()
+_DATA_MANAGER = DataManager(validate=True)
+
+# Files checked by the parametrized tests, collected once at import
+_CONFIG_FILES = sorted((project_root / 'configs').glob('config_*.json'))
+_LOG_FILES = list((project_root / 'logs').glob('predictions_*.jsonl'))[:3]  # Test first 3 files
+
+
+def _peek_jsonl(path):
+    """Return the first record of a JSONL file and its number of records, parsing only the first."""
+    first = None
+    count = 0
+    for line in iter_jsonl_lines(path):
+        if line.strip():
+            if first is None:
+                first = json.loads(line)
+            count += 1
+    return first, count
+
+
+def _read_json(path):
+    """Read a JSON output file without schema validation (tests 04/05 validate them)."""
+    return json_decode(Path(path).read_bytes())
+
+
+def _field_array(records, key):
+    """Collect an integer field of every record into a numpy array."""
+    return np.fromiter((r[key] for r in records), dtype=np.int64, count=len(records))
+
+
+def _first_mismatch(actual, expected):
+    """Index of the first differing element of two equal-length arrays (None if equal)."""
+    diff = np.flatnonzero(actual != expected)
+    return int(diff[0]) if diff.size else None
+
+
+def test_config_files_found():
+    """Test that configuration files exist."""
+    assert _CONFIG_FILES, "No config files found"
+
+
+@pytest.mark.parametrize('config_file', _CONFIG_FILES, ids=lambda path: path.name)
+def test_config_validation(config_file):
+    """Test that a configuration file is valid."""
+    # Validate config schema
+    config = _DATA_MANAGER.read_config(config_file)
+    assert 'simulation' in config
+    assert 'drift_phases' in config
+
+    # Validate structure
+    sim = config['simulation']
+    assert 'request_rate' in sim
+    assert 'total_requests' in sim
+    assert 'window_size' in sim
+
+    print(f"  ✓ {config_file.name} is valid")
+
+
+@pytest.mark.parametrize('log_file', _LOG_FILES, ids=lambda path: path.name)
+def test_prediction_log_validation(log_file):
+    """Test validation of a prediction log file."""
+    # Peek at the first prediction without validation (logs may contain
+    # test data from error-case tests); other lines are only counted
+    pred, count = _peek_jsonl(log_file)
+    assert count > 0, f"No predictions in {log_file.name}"
+
+    # Validate first prediction structure manually
+    assert 'timestamp' in pred
+    assert 'input_features' in pred
+    assert 'prediction' in pred
+    assert 'model_version' in pred
+
+    # Validate features (allow missing features from error-case tests)
+    features = pred['input_features']
+    assert 'feature1' in features
+    assert 'feature2' in features
+    # feature3 may be missing in error-case test data
+
+    print(f"  ✓ {log_file.name} validated ({count} predictions)")
 
 
 class TestEndToEndIntegration(unittest.TestCase):
@@ -32,8 +120,10 @@ class TestEndToEndIntegration(unittest.TestCase):
         """Set up test environment."""
         cls.project_root = Path(__file__).parent.parent
         cls.test_config = cls.project_root / 'configs' / 'config_simple.json'
-        cls.data_manager = DataManager(validate=True)
-        cls.registry = get_registry()
+        cls.data_manager = _DATA_MANAGER
+        cls.registry = _REGISTRY
+        # Keep-alive HTTP session for requests to the model service
+        cls.session = requests.Session()
 
         # Test output paths
         cls.test_date = datetime.now().strftime('%Y%m%d')
@@ -41,34 +131,17 @@ class TestEndToEndIntegration(unittest.TestCase):
         cls.test_metadata = cls.project_root / 'outputs' / 'metadata' / 'window_metadata.json'
         cls.test_detection = cls.project_root / 'outputs' / 'detection' / 'drift_detection.json'
 
-    def test_01_config_validation(self):
-        """Test that configuration files are valid."""
-        print("\n[TEST] Validating configuration files...")
-
-        config_files = list((self.project_root / 'configs').glob('config_*.json'))
-        self.assertGreater(len(config_files), 0, "No config files found")
-
-        for config_file in config_files:
-            with self.subTest(config=config_file.name):
-                # Validate config schema
-                config = self.data_manager.read_config(config_file)
-                self.assertIn('simulation', config)
-                self.assertIn('drift_phases', config)
-
-                # Validate structure
-                sim = config['simulation']
-                self.assertIn('request_rate', sim)
-                self.assertIn('total_requests', sim)
-                self.assertIn('window_size', sim)
-
-                print(f"  ✓ {config_file.name} is valid")
+    @classmethod
+    def tearDownClass(cls):
+        """Close the HTTP session."""
+        cls.session.close()
 
     def test_02_model_service_health(self):
         """Test that model service is accessible (if running)."""
         print("\n[TEST] Checking model service health...")
 
         try:
-            response = requests.get('http://localhost:8000/', timeout=2)
+            response = self.session.get('http://localhost:8000/', timeout=2)
             if response.status_code == 200:
                 data = response.json()
                 self.assertIn('status', data)
@@ -79,36 +152,6 @@ class TestEndToEndIntegration(unittest.TestCase):
         except requests.exceptions.RequestException:
             self.skipTest("Model service not running - skipping service tests")
 
-    def test_03_prediction_log_validation(self):
-        """Test validation of prediction log files."""
-        print("\n[TEST] Validating prediction log files...")
-
-        log_files = list((self.project_root / 'logs').glob('predictions_*.jsonl'))
-
-        if len(log_files) == 0:
-            self.skipTest("No prediction log files found")
-
-        for log_file in log_files[:3]:  # Test first 3 files
-            with self.subTest(log=log_file.name):
-                # Read predictions without validation (logs may contain test data from error-case tests)
-                predictions = self.data_manager.read_predictions(log_file, validate=False)
-                self.assertGreater(len(predictions), 0, f"No predictions in {log_file.name}")
-
-                # Validate first prediction structure manually
-                pred = predictions[0]
-                self.assertIn('timestamp', pred)
-                self.assertIn('input_features', pred)
-                self.assertIn('prediction', pred)
-                self.assertIn('model_version', pred)
-
-                # Validate features (allow missing features from error-case tests)
-                features = pred['input_features']
-                self.assertIn('feature1', features)
-                self.assertIn('feature2', features)
-                # feature3 may be missing in error-case test data
-
-                print(f"  ✓ {log_file.name} validated ({len(predictions)} predictions)")
-
     def test_04_window_metadata_validation(self):
         """Test validation of window metadata."""
         print("\n[TEST] Validating window metadata...")
@@ -130,8 +173,8 @@ class TestEndToEndIntegration(unittest.TestCase):
         self.assertIn('number_of_predictions', window)
 
         # Validate window IDs are sequential
-        for i, window in enumerate(windows):
-            self.assertEqual(window['window_id'], i, f"Window ID not sequential at index {i}")
+        mismatch = _first_mismatch(_field_array(windows, 'window_id'), np.arange(len(windows)))
+        self.assertIsNone(mismatch, f"Window ID not sequential at index {mismatch}")
 
         print(f"  ✓ Window metadata validated ({len(windows)} windows)")
 
@@ -157,8 +200,8 @@ class TestEndToEndIntegration(unittest.TestCase):
             self.assertIn(field, det, f"Missing field: {field}")
 
         # Validate window IDs are sequential
-        for i, det in enumerate(detections):
-            self.assertEqual(det['window_id'], i, f"Detection window ID not sequential at index {i}")
+        mismatch = _first_mismatch(_field_array(detections, 'window_id'), np.arange(len(detections)))
+        self.assertIsNone(mismatch, f"Detection window ID not sequential at index {mismatch}")
 
         # Count drift detections
         drift_count = sum(1 for d in detections if d['drift_detected'])
@@ -171,9 +214,9 @@ class TestEndToEndIntegration(unittest.TestCase):
         if not self.test_metadata.exists() or not self.test_detection.exists():
             self.skipTest("Required files not found")
 
-        # Read both files
-        windows = self.data_manager.read_window_metadata(self.test_metadata)
-        detections = self.data_manager.read_drift_detections(self.test_detection)
+        # Read both files (schema validation is covered by tests 04 and 05)
+        windows = _read_json(self.test_metadata)
+        detections = _read_json(self.test_detection)
 
         # Filter out incomplete windows from detections (windows with < 100 predictions)
         # This handles cases where batch analyzer processed incomplete final window
@@ -190,14 +233,15 @@ class TestEndToEndIntegration(unittest.TestCase):
                      f"Total detections: {len(detections)}")
 
         # Validate window IDs match
-        for window, detection in zip(windows, detections_to_check):
-            self.assertEqual(window['window_id'], detection['window_id'],
-                           f"Window ID mismatch at index {window['window_id']}")
+        window_ids = _field_array(windows, 'window_id')
+        mismatch = _first_mismatch(window_ids, _field_array(detections_to_check, 'window_id'))
+        self.assertIsNone(mismatch, f"Window ID mismatch at index {mismatch}")
 
-            # Validate prediction counts match
-            self.assertEqual(window['number_of_predictions'],
-                           detection['predictions_processed'],
-                           f"Prediction count mismatch for window {window['window_id']}")
+        # Validate prediction counts match
+        mismatch = _first_mismatch(_field_array(windows, 'number_of_predictions'),
+                                   _field_array(detections_to_check, 'predictions_processed'))
+        self.assertIsNone(mismatch, f"Prediction count mismatch for window "
+                                    f"{None if mismatch is None else window_ids[mismatch]}")
 
         print(f"  ✓ Data consistency validated ({len(windows)} windows)")
 
@@ -208,28 +252,19 @@ class TestEndToEndIntegration(unittest.TestCase):
         if not self.test_metadata.exists() or not self.test_detection.exists():
             self.skipTest("Required files not found")
 
-        # Read both files
-        windows = self.data_manager.read_window_metadata(self.test_metadata)
-        detections = self.data_manager.read_drift_detections(self.test_detection)
+        # Read both files (schema validation is covered by tests 04 and 05)
+        windows = _read_json(self.test_metadata)
+        detections = _read_json(self.test_detection)
+
+        # Calculate metrics over the windows present in both files
+        n = min(len(windows), len(detections))
+        ground_truth = np.fromiter((w['is_drift'] for w in windows[:n]), dtype=bool, count=n)
+        detected = np.fromiter((d['drift_detected'] for d in detections[:n]), dtype=bool, count=n)
 
-        # Calculate metrics
-        true_positives = 0
-        false_positives = 0
-        true_negatives = 0
-        false_negatives = 0
-
-        for window, detection in zip(windows, detections):
-            ground_truth = window['is_drift']
-            detected = detection['drift_detected']
-
-            if ground_truth and detected:
-                true_positives += 1
-            elif not ground_truth and detected:
-                false_positives += 1
-            elif not ground_truth and not detected:
-                true_negatives += 1
-            elif ground_truth and not detected:
-                false_negatives += 1
+        true_positives = int(np.count_nonzero(ground_truth & detected))
+        false_positives = int(np.count_nonzero(~ground_truth & detected))
+        true_negatives = int(np.count_nonzero(~ground_truth & ~detected))
+        false_negatives = int(np.count_nonzero(ground_truth & ~detected))
 
         total = len(windows)
         accuracy = (true_positives + true_negatives) / total if total > 0 else 0
@@ -305,9 +340,10 @@ class TestEndToEndIntegration(unittest.TestCase):
 class TestSchemaRegistry(unittest.TestCase):
     """Test schema registry functionality."""
 
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         """Set up test environment."""
-        self.registry = get_registry()
+        cls.registry = _REGISTRY
 
     def test_list_schemas(self):
         """Test listing available schemas."""
@@ -336,6 +372,15 @@ def run_integration_tests():
     loader = unittest.TestLoader()
     suite = unittest.TestSuite()
 
+    # Add the parametrized file checks, one case per file
+    suite.addTest(unittest.FunctionTestCase(test_config_files_found))
+    for config_file in _CONFIG_FILES:
+        suite.addTest(unittest.FunctionTestCase(lambda path=config_file: test_config_validation(path),
+                                                description=f"config: {config_file.name}"))
+    for log_file in _LOG_FILES:
+        suite.addTest(unittest.FunctionTestCase(lambda path=log_file: test_prediction_log_validation(path),
+                                                description=f"prediction log: {log_file.name}"))
+
     # Add test classes
     suite.addTests(loader.loadTestsFromTestCase(TestEndToEndIntegration))
     suite.addTests(loader.loadTestsFromTestCase(TestSchemaRegistry))
@@ -2,17 +2,35 @@
 Test script for Epic 1: Local Model Service
 Tests the /predict endpoint and verifies logging functionality.
 """
+import functools
 import requests
+from requests.adapters import HTTPAdapter
 import json
-import time
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import pytest
 
+# Add project root to path so the tests package resolves when run as a script
+sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from tests.log_helpers import count_and_last_line
+
+# Keep-alive session shared by all requests to the service
+_SESSION = requests.Session()
+_SESSION.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=4))
+
+
+def teardown_module(module):
+    """Close the shared session's pooled connections after the module's tests."""
+    _SESSION.close()
+
+
+@functools.lru_cache(maxsize=1)
 def _check_service_running():
-    """Check if model service is running."""
+    """Check if model service is running (probed once per session)."""
     try:
-        response = requests.get("http://localhost:8000/", timeout=1)
+        response = _SESSION.get("http://localhost:8000/", timeout=1)
         return response.status_code == 200
     except requests.exceptions.RequestException:
         return False
@@ -22,7 +40,7 @@ def _check_service_running():
 def test_health_check():
     """Test the health check endpoint."""
     print("Testing health check endpoint...")
-    response = requests.get("http://localhost:8000/")
+    response = _SESSION.get("http://localhost:8000/")
     print(f"Status: {response.status_code}")
     print(f"Response: {response.json()}\n")
     assert response.status_code == 200
@@ -42,7 +60,7 @@ def test_predict_endpoint():
         }
     }
 
-    response = requests.post(
+    response = _SESSION.post(
         "http://localhost:8000/predict",
         json=test_request
     )
@@ -70,19 +88,20 @@ def test_multiple_predictions():
         {"feature1": 3.0, "feature2": 1.0, "feature3": 0.5},
     ]
 
-    for i, features in enumerate(test_cases, 1):
-        response = requests.post(
-            "http://localhost:8000/predict",
-            json={"features": features}
-        )
+    # Send all requests concurrently over the shared session's connection pool
+    with ThreadPoolExecutor(max_workers=len(test_cases)) as executor:
+        responses = list(executor.map(
+            lambda features: _SESSION.post("http://localhost:8000/predict", json={"features": features}),
+            test_cases
+        ))
+
+    for i, response in enumerate(responses, 1):
         assert response.status_code == 200, f"Test {i}: FAILED with status {response.status_code}"
         result = response.json()
         print(f"  Test {i}: prediction={result['prediction']:.4f}")
         assert "prediction" in result
         assert 0 <= result["prediction"] <= 1
 
-        time.sleep(0.1)  # Small delay between requests
-
     print()
 
 
@@ -104,14 +123,13 @@ def verify_logs():
     latest_log = sorted(log_files)[-1]
     print(f"  ✓ Found log file: {latest_log}")
 
-    with open(latest_log, "r") as f:
-        lines = f.readlines()
+    count, last_line = count_and_last_line(latest_log)
 
-    print(f"  ✓ Number of logged predictions: {len(lines)}")
+    print(f"  ✓ Number of logged predictions: {count}")
 
     # Show a sample log entry
-    if lines:
-        sample = json.loads(lines[-1])
+    if last_line:
+        sample = json.loads(last_line)
         print(f"  ✓ Sample log entry:")
         print(json.dumps(sample, indent=4))
 
@@ -0,0 +1,187 @@
+"""
+Unit tests for Data Manager
+
+Tests prediction log round trips: batched and template-based appends,
+zstd-compressed logs and columnar reads.
+"""
+
+import pytest
+import json
+import numpy as np
+from pathlib import Path
+import sys
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.data_manager import DataManager, FEATURE_NAMES, ValidationError, zstandard
+
+requires_zstd = pytest.mark.skipif(zstandard is None, reason="zstandard not installed")
+
+# zstd frame magic number (little-endian 0xFD2FB528)
+ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'
+
+
+class TestAppendPredictions:
+    """Tests for batched prediction appends."""
+
+    def test_batch_round_trip(self, temp_dir, sample_predictions_list):
+        """Test that a batch append reads back as the same records, in order."""
+        log_file = temp_dir / "predictions.jsonl"
+        with DataManager() as manager:
+            manager.append_predictions(log_file, sample_predictions_list[:60])
+            manager.append_predictions(log_file, iter(sample_predictions_list[60:]))
+            assert manager.read_predictions(log_file) == sample_predictions_list
+
+    def test_invalid_item_writes_nothing(self, temp_dir, sample_predictions_list,
+                                         invalid_prediction):
+        """Test that a batch with an invalid record is rejected as a whole."""
+        log_file = temp_dir / "predictions.jsonl"
+        with DataManager() as manager:
+            with pytest.raises(ValidationError):
+                manager.append_predictions(log_file, sample_predictions_list[:3] + [invalid_prediction])
+
+        assert not log_file.exists() or log_file.read_bytes() == b''
+
+
+class TestAppendPredictionFast:
+    """Tests for the template-based single prediction append."""
+
+    @pytest.mark.parametrize("value", [0.085, 1 / 3, 1e16, 1e-7, -0.0, 5.0, 123456789.125])
+    def test_parses_to_same_record_as_append_prediction(self, temp_dir, value):
+        """Test that fast and dict appends decode to equal records.
+
+        The raw lines need not match byte for byte: repr and orjson format
+        some floats differently (e.g. 1e+16 vs 1e16).
+        """
+        record = {
+            "timestamp": "2025-12-13T10:00:00Z",
+            "input_features": {"feature1": value, "feature2": 2.0, "feature3": -value},
+            "prediction": value,
+            "model_version": "v1.0",
+            "drift_phase": 2
+        }
+        dict_log = temp_dir / "dict.jsonl"
+        fast_log = temp_dir / "fast.jsonl"
+
+        with DataManager(validate=False) as manager:
+            manager.append_prediction(dict_log, record)
+            manager.append_prediction_fast(fast_log, record["timestamp"],
+                                           np.array([value, 2.0, -value]), value,
+                                           record["model_version"], record["drift_phase"])
+
+        fast = json.loads(fast_log.read_bytes())
+        assert fast == json.loads(dict_log.read_bytes())
+        assert list(fast) == list(record)
+        assert fast["prediction"] == value
+
+    def test_validation_still_applies(self, temp_dir):
+        """Test that an invalid fast append is rejected when validation is on."""
+        log_file = temp_dir / "predictions.jsonl"
+        with DataManager() as manager:
+            with pytest.raises(ValidationError):
+                manager.append_prediction_fast(log_file, "2025-12-13T10:00:00Z",
+                                               [5.0, 2.0, 1.3], 0.5, "v1.0", drift_phase=0)
+
+
+@requires_zstd
+class TestCompressedLogs:
+    """Tests for zstd-compressed .jsonl.zst prediction logs."""
+
+    def test_compressed_log_path(self, temp_dir):
+        """Test that compressed=True selects a .jsonl.zst file name."""
+        path = DataManager(validate=False).get_prediction_log_path(logs_dir=temp_dir, compressed=True)
+
+        assert path.name.endswith('.jsonl.zst')
+
+    def test_multi_frame_round_trip(self, temp_dir, sample_predictions_list):
+        """Test that a log written across several flushes decodes completely."""
+        log_file = temp_dir / "predictions.jsonl.zst"
+        first, second, third = (sample_predictions_list[:30], sample_predictions_list[30:70],
+                                sample_predictions_list[70:])
+
+        with DataManager() as manager:
+            for prediction in first:
+                manager.append_prediction(log_file, prediction)
+            manager.flush()
+            manager.append_predictions(log_file, second)
+            # Reads flush the open writer, ending another frame
+            assert manager.read_predictions(log_file) == first + second
+
+        # A later writer appends further frames to the same file
+        with DataManager() as manager:
+            manager.append_predictions(log_file, third)
+
+        assert log_file.read_bytes().count(ZSTD_MAGIC) >= 3
+        assert DataManager().read_predictions(log_file) == sample_predictions_list
+
+    def test_flushed_frames_readable_while_open(self, temp_dir, sample_predictions_list):
+        """Test that another reader sees every flushed record before close()."""
+        log_file = temp_dir / "predictions.jsonl.zst"
+        manager = DataManager(validate=False)
+        try:
+            manager.append_predictions(log_file, sample_predictions_list[:10])
+            manager.flush()
+
+            assert DataManager(validate=False).read_predictions(log_file) == sample_predictions_list[:10]
+        finally:
+            manager.close()
+
+
+class TestColumnarRead:
+    """Tests for read_predictions_columnar."""
+
+    def test_matches_read_predictions(self, temp_dir, sample_predictions_list):
+        """Test that columns hold the same values as the record-wise read."""
+        log_file = temp_dir / "predictions.jsonl"
+        with DataManager() as manager:
+            manager.append_predictions(log_file, sample_predictions_list)
+            records = manager.read_predictions(log_file)
+            columns = manager.read_predictions_columnar(log_file)
+
+        assert columns['timestamp'] == [r['timestamp'] for r in records]
+        np.testing.assert_array_equal(columns['prediction'], [r['prediction'] for r in records])
+        np.testing.assert_array_equal(columns['drift_phase'], [r['drift_phase'] for r in records])
+        np.testing.assert_array_equal(
+            columns['input_features'],
+            [[r['input_features'][name] for name in FEATURE_NAMES] for r in records]
+        )
+        assert columns['prediction'].dtype == np.float64
+        assert columns['drift_phase'].dtype == np.int32
+
+    def test_missing_drift_phase_defaults_to_zero(self, temp_dir, sample_prediction):
+        """Test that records without drift_phase get phase 0."""
+        log_file = temp_dir / "predictions.jsonl"
+        record = {k: v for k, v in sample_prediction.items() if k != 'drift_phase'}
+        with DataManager(validate=False) as manager:
+            manager.append_prediction(log_file, record)
+            columns = manager.read_predictions_columnar(log_file)
+
+        assert columns['drift_phase'].tolist() == [0]
+        assert columns['input_features'].shape == (1, len(FEATURE_NAMES))
+
+    def test_empty_log(self, temp_dir):
+        """Test that an empty log gives empty, correctly shaped columns."""
+        log_file = temp_dir / "empty.jsonl"
+        log_file.touch()
+
+        columns = DataManager(validate=False).read_predictions_columnar(log_file)
+
+        assert columns['timestamp'] == []
+        assert columns['prediction'].size == 0
+        assert columns['input_features'].shape == (0, len(FEATURE_NAMES))
+
+    @requires_zstd
+    def test_compressed_log_matches_plain(self, temp_dir, sample_predictions_list):
+        """Test that columnar reads of .jsonl and .jsonl.zst logs agree."""
+        plain = temp_dir / "predictions.jsonl"
+        compressed = temp_dir / "predictions.jsonl.zst"
+        with DataManager(validate=False) as manager:
+            manager.append_predictions(plain, sample_predictions_list)
+            manager.append_predictions(compressed, sample_predictions_list)
+            plain_columns = manager.read_predictions_columnar(plain)
+            compressed_columns = manager.read_predictions_columnar(compressed)
+
+        assert plain_columns['timestamp'] == compressed_columns['timestamp']
+        for key in ('prediction', 'drift_phase', 'input_features'):
+            np.testing.assert_array_equal(plain_columns[key], compressed_columns[key])
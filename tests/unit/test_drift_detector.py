@@ -14,7 +14,7 @@ import sys
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from src.drift_detector import DriftDetector, WindowedPredictions
+from src.drift_detector import DriftDetector, WindowedPredictions, adwin_scan
 
 
 class TestPredictionLoading:
@@ -158,6 +158,21 @@ class TestWindowStatistics:
         window = WindowedPredictions(0, predictions)
         assert window.timestamp == "2025-12-13T10:02:00Z"
 
+    def test_windowed_stats_match_per_window_values(self):
+        """Test that stats batched in create_windows match each window's values."""
+        predictions = [
+            {"prediction": float(v), "timestamp": "2025-12-13T10:00:00Z"}
+            for v in np.random.default_rng(0).random(250)
+        ]
+
+        detector = DriftDetector(window_size=100)
+        windows = detector.create_windows(predictions)
+
+        assert [w.count for w in windows] == [100, 100, 50]
+        for window in windows:
+            assert abs(window.mean - np.mean(window.prediction_values)) < 1e-12
+            assert abs(window.std - np.std(window.prediction_values)) < 1e-12
+
 
 class TestADWINDriftDetection:
     """TEST-DD-003: Tests for ADWIN drift detection algorithm."""
@@ -229,6 +244,39 @@ class TestADWINDriftDetection:
         expected_stat = abs(0.5 - 0.1)
         assert abs(result2["drift_statistic"] - expected_stat) < 0.001
 
+    def test_adwin_scan_matches_river(self):
+        """Test that the compiled ADWIN scan flags the same samples as river."""
+        from river.drift import ADWIN
+
+        rng = np.random.default_rng(7)
+        values = np.concatenate([rng.normal(0.2, 0.05, 1500), rng.normal(0.6, 0.05, 1500)])
+
+        adwin = ADWIN(delta=0.002)
+        expected = []
+        for v in values.tolist():
+            adwin.update(v)
+            expected.append(adwin.drift_detected)
+
+        flags = adwin_scan(values, 0.002)
+        assert flags.tolist() == expected
+        assert flags.any()
+
+    def test_parallel_processing_finds_shift_in_later_chunk(self):
+        """Test that chunked parallel processing detects a shift after the first chunk."""
+        rng = np.random.default_rng(3)
+        values = np.concatenate([rng.normal(0.2, 0.02, 3000), rng.normal(0.6, 0.02, 1000)])
+        predictions = [{"prediction": float(v), "timestamp": "2025-12-13T10:00:00Z"} for v in values]
+
+        sequential = DriftDetector(window_size=100)
+        sequential.process_all_windows(predictions, verbose=False)
+        parallel = DriftDetector(window_size=100)
+        parallel.process_all_windows_parallel(predictions, workers=2, verbose=False)
+
+        assert len(parallel.detection_results) == 40
+        assert parallel.detection_results[30]["drift_detected"] is True
+        assert [r["drift_detected"] for r in parallel.detection_results] == \
+            [r["drift_detected"] for r in sequential.detection_results]
+
 
 class TestGroundTruthComparison:
     """TEST-DD-005: Tests for ground truth comparison functionality."""
@@ -336,3 +384,20 @@ class TestDetectionResultFormat:
         result = detector.detect_drift_in_window(windows[0])
 
         assert result["predictions_processed"] == windows[0].count
+
+    def test_jsonl_results_match_json_results(self, sample_predictions_list, temp_dir):
+        """Test that JSONL output holds the same results as the JSON file."""
+        detector = DriftDetector(window_size=50)
+        detector.process_all_windows(sample_predictions_list, verbose=False)
+
+        json_path = temp_dir / "results.json"
+        jsonl_path = temp_dir / "results.jsonl"
+        detector.save_results(str(json_path))
+        detector.save_results_jsonl(str(jsonl_path))
+
+        with open(json_path) as f:
+            expected = json.load(f)
+        with open(jsonl_path) as f:
+            lines = f.read().splitlines()
+
+        assert [json.loads(line) for line in lines] == expected
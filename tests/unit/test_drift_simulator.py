@@ -259,7 +259,7 @@ class TestRequestSending:
             "timestamp": "2025-12-13T10:00:00Z"
         }
 
-        with patch('requests.post', return_value=mock_response):
+        with patch.object(simulator.session, 'post', return_value=mock_response):
             result = simulator.send_prediction_request({"feature1": 5.0, "feature2": 2.0, "feature3": 1.3})
 
         assert result is not None
@@ -272,8 +272,8 @@ class TestRequestSending:
 
         initial_failures = simulator.requests_failed
 
-        # Mock failed response - need to patch in the right module and raise correct exception type
-        with patch('src.drift_simulator.requests.post', side_effect=requests.exceptions.RequestException("Connection error")):
+        # Mock failed response on the simulator's session and raise correct exception type
+        with patch.object(simulator.session, 'post', side_effect=requests.exceptions.RequestException("Connection error")):
             result = simulator.send_prediction_request({"feature1": 5.0, "feature2": 2.0, "feature3": 1.3})
 
         assert result is None
@@ -284,8 +284,8 @@ class TestRequestSending:
         import requests
         simulator = DriftSimulator(str(sample_config_file))
 
-        # Mock network error - patch in the right module and raise correct exception type
-        with patch('src.drift_simulator.requests.post', side_effect=requests.exceptions.RequestException("Network error")):
+        # Mock network error on the simulator's session and raise correct exception type
+        with patch.object(simulator.session, 'post', side_effect=requests.exceptions.RequestException("Network error")):
             # Should not raise exception
             result = simulator.send_prediction_request({"feature1": 5.0, "feature2": 2.0, "feature3": 1.3})
 
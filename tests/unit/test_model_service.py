@@ -376,3 +376,49 @@ class TestPredictionLogging:
             lines = f.readlines()
 
         assert len(lines) == 3  # Three predictions
+
+
+class TestPredictionBatching:
+    """TEST-MS-006: Tests for coalescing concurrent predictions into batched model calls."""
+
+    def test_concurrent_requests_share_model_calls(self):
+        """Test that concurrent rows are scored together and answered in order."""
+        import asyncio
+        from src.model_service import PredictionBatcher
+
+        batch_sizes = []
+
+        def predict_fn(features):
+            batch_sizes.append(len(features))
+            return features.sum(axis=1)
+
+        async def run():
+            batcher = PredictionBatcher(predict_fn, max_batch=8)
+            rows = [[float(i), 1.0, 2.0] for i in range(20)]
+            results = await asyncio.gather(*[batcher.predict(row) for row in rows])
+            await batcher.close()
+            return results
+
+        results = asyncio.run(run())
+
+        assert results == [i + 3.0 for i in range(20)]
+        assert batch_sizes == [8, 8, 4]
+
+    def test_model_error_propagates_to_each_request(self):
+        """Test that a failing model call fails every request in the batch."""
+        import asyncio
+        from src.model_service import PredictionBatcher
+
+        def predict_fn(features):
+            raise ValueError("bad input")
+
+        async def run():
+            batcher = PredictionBatcher(predict_fn)
+            results = await asyncio.gather(*[batcher.predict([1.0, 2.0, 3.0]) for _ in range(3)],
+                                           return_exceptions=True)
+            await batcher.close()
+            return results
+
+        results = asyncio.run(run())
+
+        assert all(isinstance(r, ValueError) for r in results)
@@ -0,0 +1,327 @@
+"""
+Unit tests for the Real-Time Drift Analyzer
+
+Tests the sliding prediction window statistics, batch processing,
+alert dispatch and log tailing (partial lines, truncation, rotation).
+"""
+
+import pytest
+import json
+import os
+import threading
+import numpy as np
+from pathlib import Path
+import sys
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from realtime_drift_analyzer import (
+    AlertDispatcher,
+    DriftAlert,
+    LogChangeWaiter,
+    PredictionLogMonitor,
+    PredictionWindow,
+    RealtimeDriftDetector,
+    _welford_add,
+    _welford_remove,
+)
+
+
+def _record(value, index=0):
+    """One prediction log line as written by the model service."""
+    return json.dumps({"timestamp": f"2025-12-13T10:00:{index % 60:02d}Z", "prediction": value}) + "\n"
+
+
+def _alert(window_id, drift_detected):
+    """Minimal DriftAlert for dispatcher tests."""
+    return DriftAlert(
+        window_id=window_id,
+        timestamp="2025-12-13T10:00:00Z",
+        drift_detected=drift_detected,
+        drift_statistic=0.0,
+        baseline_mean=0.5,
+        current_mean=0.5,
+        current_std=0.1,
+        predictions_in_window=10
+    )
+
+
+@pytest.fixture
+def drifting_values():
+    """Prediction values whose mean shifts halfway through."""
+    rng = np.random.default_rng(42)
+    return np.concatenate([rng.normal(0.3, 0.05, 1000), rng.normal(0.7, 0.05, 1000)])
+
+
+@pytest.fixture
+def monitor_factory(temp_dir):
+    """Build quiet PredictionLogMonitors on a temp log, closing them afterwards."""
+    monitors = []
+
+    def make(window_size=2, from_beginning=False):
+        detector = RealtimeDriftDetector(window_size=window_size)
+        monitor = PredictionLogMonitor(temp_dir / "predictions.jsonl", detector,
+                                       verbose=False, from_beginning=from_beginning)
+        monitors.append(monitor)
+        return monitor, detector
+
+    yield make
+    for monitor in monitors:
+        monitor.close()
+
+
+class TestWelfordMoments:
+    """Tests for the running mean/M2 updates behind PredictionWindow."""
+
+    def test_add_matches_numpy(self):
+        """Test that adding values reproduces numpy mean and variance."""
+        values = np.random.default_rng(0).normal(5.0, 2.0, 500)
+        count, mean, m2 = 0, 0.0, 0.0
+        for value in values:
+            count, mean, m2 = _welford_add(count, mean, m2, value)
+
+        assert count == 500
+        assert mean == pytest.approx(values.mean(), rel=1e-12)
+        assert m2 / count == pytest.approx(values.var(), rel=1e-10)
+
+    def test_remove_inverts_add(self):
+        """Test that removing the oldest values leaves the moments of the rest."""
+        values = np.random.default_rng(1).normal(0.5, 0.1, 200)
+        count, mean, m2 = 0, 0.0, 0.0
+        for value in values:
+            count, mean, m2 = _welford_add(count, mean, m2, value)
+        for value in values[:150]:
+            count, mean, m2 = _welford_remove(count, mean, m2, value)
+
+        assert count == 50
+        assert mean == pytest.approx(values[150:].mean(), rel=1e-10)
+        assert m2 / count == pytest.approx(values[150:].var(), rel=1e-8)
+
+    def test_remove_last_value_resets(self):
+        """Test that removing the only value returns empty moments."""
+        count, mean, m2 = _welford_add(0, 0.0, 0.0, 3.0)
+
+        assert _welford_remove(count, mean, m2, 3.0) == (0, 0.0, 0.0)
+
+
+class TestPredictionWindow:
+    """Tests for the ring-buffer prediction window."""
+
+    def test_sliding_window_matches_numpy(self):
+        """Test that mean/std track numpy over the last window_size values as it slides."""
+        values = np.random.default_rng(2).normal(100.0, 0.5, 5000)
+        window = PredictionWindow(window_size=50)
+
+        for i, value in enumerate(values):
+            window.add_prediction({"prediction": value})
+            expected = values[max(0, i - 49):i + 1]
+            if i % 97 == 0 or i == len(values) - 1:
+                np.testing.assert_array_equal(window.get_prediction_values(), expected)
+                assert window.get_mean() == pytest.approx(expected.mean(), rel=1e-12)
+                assert window.get_std() == pytest.approx(expected.std(), rel=1e-8)
+
+    def test_add_values_matches_add_prediction(self):
+        """Test that block appends give the same window as per-value appends."""
+        values = np.random.default_rng(3).normal(0.5, 0.2, 40)
+        single = PredictionWindow(window_size=40)
+        block = PredictionWindow(window_size=40)
+
+        for value in values:
+            single.add_prediction({"prediction": value, "timestamp": "t"})
+        for chunk in np.split(values, [7, 8, 30]):
+            block.add_values(chunk, "t")
+
+        np.testing.assert_array_equal(block.get_prediction_values(), single.get_prediction_values())
+        assert block.get_mean() == pytest.approx(single.get_mean(), rel=1e-12)
+        assert block.get_std() == pytest.approx(single.get_std(), rel=1e-10)
+        assert block.is_complete() and single.is_complete()
+
+    def test_clear_resets_and_increments_id(self):
+        """Test that clearing empties the window and advances window_id."""
+        window = PredictionWindow(window_size=3)
+        window.add_prediction({"prediction": 0.5})
+        window.clear()
+
+        assert window.get_count() == 0
+        assert window.get_mean() == 0.0
+        assert window.get_std() == 0.0
+        assert window.window_id == 1
+
+
+class TestProcessBatch:
+    """Tests for RealtimeDriftDetector.process_batch."""
+
+    def test_batch_matches_per_record_processing(self, drifting_values):
+        """Test that process_batch yields the same alerts as process_prediction."""
+        timestamps = [f"ts-{i}" for i in range(len(drifting_values))]
+        per_record = RealtimeDriftDetector(window_size=25)
+        batched = RealtimeDriftDetector(window_size=25)
+
+        expected = []
+        for value, timestamp in zip(drifting_values, timestamps):
+            alert = per_record.process_prediction({"prediction": value, "timestamp": timestamp})
+            if alert:
+                expected.append(alert)
+
+        actual = []
+        bounds = [0, 3, 60, 61, 500, 1234, len(drifting_values)]
+        for start, stop in zip(bounds, bounds[1:]):
+            actual.extend(batched.process_batch(drifting_values[start:stop], timestamps[start:stop]))
+
+        assert len(actual) == len(expected) == 80
+        for got, want in zip(actual, expected):
+            assert (got.window_id, got.timestamp, got.drift_detected, got.adwin_drift,
+                    got.baseline_drift, got.predictions_in_window) == \
+                   (want.window_id, want.timestamp, want.drift_detected, want.adwin_drift,
+                    want.baseline_drift, want.predictions_in_window)
+            assert got.current_mean == pytest.approx(want.current_mean, rel=1e-12)
+            assert got.current_std == pytest.approx(want.current_std, rel=1e-9)
+        batched_summary, per_record_summary = batched.get_summary(), per_record.get_summary()
+        assert batched_summary.pop('baseline_mean') == pytest.approx(per_record_summary.pop('baseline_mean'))
+        assert batched_summary == per_record_summary
+        assert batched.drift_count > 0
+
+    def test_empty_batch_is_noop(self):
+        """Test that an empty batch produces no alerts."""
+        detector = RealtimeDriftDetector(window_size=5)
+
+        assert detector.process_batch(np.array([]), []) == []
+        assert detector.total_predictions == 0
+
+
+class TestAlertDispatcher:
+    """Tests for background alert delivery."""
+
+    def test_drift_alerts_never_dropped(self):
+        """Test that a full queue drops stable alerts but waits for drift alerts."""
+        release = threading.Event()
+        delivered = []
+
+        def handler(alert):
+            release.wait()
+            delivered.append(alert)
+
+        dispatcher = AlertDispatcher(handler, maxsize=2)
+        for i in range(10):
+            dispatcher.submit(_alert(i, drift_detected=False))
+        threading.Timer(0.2, release.set).start()
+        for i in range(10, 20):
+            dispatcher.submit(_alert(i, drift_detected=True))
+        dispatcher.close()
+
+        drift_ids = [alert.window_id for alert in delivered if alert.drift_detected]
+        assert drift_ids == list(range(10, 20))
+        assert dispatcher.dropped == 10 - (len(delivered) - len(drift_ids))
+        assert dispatcher.dropped > 0
+
+    def test_handler_errors_do_not_stop_delivery(self):
+        """Test that a failing handler call does not stop later alerts."""
+        delivered = []
+
+        def handler(alert):
+            if alert.window_id == 0:
+                raise RuntimeError("boom")
+            delivered.append(alert.window_id)
+
+        dispatcher = AlertDispatcher(handler)
+        dispatcher.submit(_alert(0, drift_detected=True))
+        dispatcher.submit(_alert(1, drift_detected=True))
+        dispatcher.close()
+
+        assert delivered == [1]
+
+
+class TestLogChangeWaiter:
+    """Tests for waiting on log file changes."""
+
+    def test_missing_directory_falls_back_to_sleep(self, temp_dir):
+        """Test that a log in a not-yet-created directory does not fail construction."""
+        waiter = LogChangeWaiter(temp_dir / "missing" / "predictions.jsonl")
+        try:
+            waiter.wait(0.01)
+        finally:
+            waiter.close()
+
+    def test_wakes_on_append(self, temp_dir):
+        """Test that wait returns once the log is written to."""
+        log_file = temp_dir / "predictions.jsonl"
+        log_file.touch()
+        waiter = LogChangeWaiter(log_file)
+        try:
+            with open(log_file, "a") as f:
+                f.write(_record(0.5))
+            waiter.wait(5.0)
+        finally:
+            waiter.close()
+
+
+class TestLogTailing:
+    """Tests for PredictionLogMonitor file tailing."""
+
+    def test_partial_line_waits_for_completion(self, temp_dir, monitor_factory):
+        """Test that a trailing partial line is held back until its newline arrives."""
+        log_file = temp_dir / "predictions.jsonl"
+        log_file.touch()
+        monitor, detector = monitor_factory()
+        line = _record(0.5, 1)
+
+        with open(log_file, "a") as f:
+            f.write(_record(0.4, 0) + line[:10])
+        assert monitor._process_new_lines() == 1
+        assert detector.total_predictions == 1
+
+        with open(log_file, "a") as f:
+            f.write(line[10:])
+        assert monitor._process_new_lines() == 1
+        assert detector.total_predictions == 2
+        assert monitor.file_position == log_file.stat().st_size
+
+    def test_truncation_rewinds_to_start(self, temp_dir, monitor_factory):
+        """Test that a log truncated in place is re-read from offset 0."""
+        log_file = temp_dir / "predictions.jsonl"
+        log_file.touch()
+        monitor, detector = monitor_factory(window_size=10)
+
+        with open(log_file, "a") as f:
+            f.write("".join(_record(0.5, i) for i in range(3)))
+        assert monitor._process_new_lines() == 3
+
+        with open(log_file, "w") as f:
+            f.write(_record(0.6, 0))
+        assert monitor._process_new_lines() == 1
+        assert detector.total_predictions == 4
+        assert monitor.file_position == log_file.stat().st_size
+
+    def test_rotation_reads_new_file_from_start(self, temp_dir, monitor_factory):
+        """Test that a rotated (new inode) log is read from the beginning."""
+        log_file = temp_dir / "predictions.jsonl"
+        log_file.write_text(_record(0.5, 0))
+        monitor, detector = monitor_factory(window_size=10)
+
+        os.rename(log_file, temp_dir / "predictions.jsonl.1")
+        log_file.write_text("".join(_record(0.5, i) for i in range(5)))
+        assert monitor._process_new_lines() == 5
+        assert detector.total_predictions == 5
+
+    def test_malformed_records_skipped_individually(self, temp_dir, monitor_factory):
+        """Test that bad records are skipped without losing the valid ones around them."""
+        log_file = temp_dir / "predictions.jsonl"
+        log_file.touch()
+        monitor, detector = monitor_factory(window_size=10)
+
+        with open(log_file, "a") as f:
+            f.write(_record(0.1) + '{"no_prediction": 1}\n' + '[1, 2]\n' + '{"prediction": "x"}\n'
+                    + '{not json\n' + _record(0.2))
+        assert monitor._process_new_lines() == 6
+        assert detector.total_predictions == 2
+
+    def test_replay_from_beginning_survives_bad_record(self, temp_dir, monitor_factory):
+        """Test that the from-beginning replay skips bad records instead of raising."""
+        log_file = temp_dir / "predictions.jsonl"
+        log_file.write_text(_record(0.1) + '{"no_prediction": 1}\n' + _record(0.2) + '{"predic')
+
+        monitor, detector = monitor_factory(window_size=10, from_beginning=True)
+
+        assert detector.total_predictions == 2
+        assert monitor.file_position == len(log_file.read_bytes()) - len('{"predic')
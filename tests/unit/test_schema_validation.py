@@ -4,6 +4,7 @@ Unit tests for Schema Validation - Epic 5
 Tests the JSON Schema validation for all data formats.
 """
 
+import copy
 import pytest
 import json
 from pathlib import Path
@@ -12,7 +13,7 @@ import sys
 # Add schemas to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'schemas'))
 
-from schema_registry import SchemaRegistry, get_registry, validate_data
+from schema_registry import SchemaRegistry, DriftValidationError, _payload_key, get_registry, validate_data
 from jsonschema import ValidationError
 
 
@@ -316,3 +317,80 @@ class TestValidationHelpers:
 
         result = registry.validate(invalid_prediction, 'prediction', raise_error=False)
         assert result is False
+
+    def test_repeated_valid_payload_served_from_cache(self, sample_prediction):
+        """Test that identical valid payloads are cached and invalid ones are not."""
+        registry = SchemaRegistry(cache_size=2)
+
+        assert registry.validate(sample_prediction, 'prediction') is True
+        assert registry.validate(dict(sample_prediction), 'prediction') is True
+        assert len(registry._validation_cache) == 1
+
+        invalid = dict(sample_prediction)
+        del invalid['timestamp']
+        with pytest.raises(ValidationError):
+            registry.validate(invalid, 'prediction')
+        assert len(registry._validation_cache) == 1
+
+    def test_validation_cache_evicts_oldest_entry(self, sample_prediction):
+        """Test that the validation cache stays within its size limit."""
+        registry = SchemaRegistry(cache_size=2)
+
+        for value in (0.1, 0.2, 0.3):
+            registry.validate({**sample_prediction, 'prediction': value}, 'prediction')
+        assert len(registry._validation_cache) == 2
+
+    def test_validation_cache_disabled_by_default(self, sample_prediction):
+        """Test that the default registry does not build cache entries."""
+        registry = SchemaRegistry()
+
+        assert registry.validate(sample_prediction, 'prediction') is True
+        assert len(registry._validation_cache) == 0
+
+    def test_validation_cache_distinguishes_tuple_from_list(self, sample_config):
+        """Test that a list payload and an equal tuple payload get different cache keys."""
+        as_list = copy.deepcopy(sample_config)
+        as_tuple = copy.deepcopy(sample_config)
+        as_tuple['drift_phases'] = tuple(as_tuple['drift_phases'])
+
+        assert _payload_key('config', as_list) != _payload_key('config', as_tuple)
+        assert _payload_key('config', as_list) == _payload_key('config', copy.deepcopy(as_list))
+
+    def test_validate_file_rechecks_modified_file(self, temp_dir, sample_prediction,
+                                                  invalid_prediction):
+        """Test that unchanged files are cached and modified files revalidated."""
+        registry = SchemaRegistry()
+        log_file = temp_dir / 'predictions.jsonl'
+        log_file.write_text(json.dumps(sample_prediction) + '\n')
+
+        assert registry.validate_file(log_file, 'prediction', is_jsonl=True) is True
+        assert registry.is_known_valid(log_file, 'prediction', is_jsonl=True)
+
+        with open(log_file, 'a') as f:
+            f.write(json.dumps(invalid_prediction) + '\n')
+        assert not registry.is_known_valid(log_file, 'prediction', is_jsonl=True)
+        assert registry.validate_file(log_file, 'prediction', is_jsonl=True,
+                                      raise_error=False) is False
+
+    def test_validate_list_accepts_generator(self, sample_predictions_list, invalid_prediction):
+        """Test that validate_list consumes iterables without needing a list."""
+        registry = get_registry()
+
+        assert registry.validate_list(iter(sample_predictions_list), 'prediction') is True
+        items = (p for p in sample_predictions_list[:3] + [invalid_prediction])
+        assert registry.validate_list(items, 'prediction', raise_error=False) is False
+
+    def test_validation_error_carries_schema_and_path(self, sample_prediction):
+        """Test that registry errors expose schema name, detail and data path."""
+        registry = get_registry()
+        del sample_prediction['input_features']['feature3']
+
+        with pytest.raises(DriftValidationError) as exc_info:
+            registry.validate(sample_prediction, 'prediction')
+
+        error = exc_info.value
+        assert isinstance(error, ValidationError)
+        assert error.schema_name == 'prediction'
+        assert list(error.path) == ['input_features']
+        assert "Validation failed for schema 'prediction'" in str(error)
+        assert str(error).endswith('Path: input_features')